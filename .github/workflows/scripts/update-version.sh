@@ -2,7 +2,8 @@
 set -euo pipefail
 
 # update-version.sh
-# Update version in pyproject.toml (for release artifacts only)
+# Update the package version in src/specify_cli/_version.py (for release artifacts only);
+# pyproject.toml reads it from there via [tool.hatch.version]
 # Usage: update-version.sh <version>
 
 if [[ $# -ne 1 ]]; then
@@ -15,9 +16,11 @@ VERSION="$1"
 # Remove 'v' prefix for Python versioning
 PYTHON_VERSION=${VERSION#v}
 
-if [ -f "pyproject.toml" ]; then
-  sed -i "s/version = \".*\"/version = \"$PYTHON_VERSION\"/" pyproject.toml
-  echo "Updated pyproject.toml version to $PYTHON_VERSION (for release artifacts only)"
+VERSION_FILE="src/specify_cli/_version.py"
+
+if [ -f "$VERSION_FILE" ]; then
+  sed -i "s/^__version__ = \".*\"/__version__ = \"$PYTHON_VERSION\"/" "$VERSION_FILE"
+  echo "Updated $VERSION_FILE version to $PYTHON_VERSION (for release artifacts only)"
 else
-  echo "Warning: pyproject.toml not found, skipping version update"
-fi
\ No newline at end of file
+  echo "Warning: $VERSION_FILE not found, skipping version update"
+fi
@@ -6,7 +6,7 @@
 #     "rich",
 #     "platformdirs",
 #     "readchar",
-#     "httpx",
+#     "httpx[http2]",
 # ]
 # ///
 """
@@ -24,57 +24,186 @@ Or install globally:
     specify init --here
 """
 
+# Bound before any other import so the version is known even if a dependency fails to import
+try:
+    from ._version import __version__
+except ImportError:  # Running this file directly as a script, outside the package
+    __version__ = "development"
+
+import atexit
+import difflib
+import functools
+import heapq
+import io
 import os
+import re
 import subprocess  # nosec B404 - subprocess is required for CLI tool functionality
 import sys
+import threading
 import zipfile
-import tempfile
 import shutil
 import json
 import time
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional, Tuple
 
 import typer
-import httpx
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
 from rich.table import Table
 from rich import box
-from rich.tree import Tree
 from typer.core import TyperGroup
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
+
+# httpx, ssl, truststore, readchar and the Rich Live/Tree/Progress widgets are
+# imported where they are used so that commands which never touch the
+# network or an interactive display (--help, status, check) start faster.
+_ssl_context: "ssl.SSLContext | None" = None
+
+
+def _get_ssl_context() -> "ssl.SSLContext":
+    """Return the truststore-backed SSL context, building it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+
+        import truststore
+        _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
+
+
+def __getattr__(name: str):
+    # Keep the historical module attribute available without eager construction
+    if name == "ssl_context":
+        return _get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Configuration constants
 CACHE_TTL_SECONDS = 3600  # Cache lifetime: 1 hour
-HTTP_CHUNK_SIZE = 8192    # Standard 8KB chunks for HTTP streaming downloads
+HTTP_CHUNK_SIZE = 1 << 20  # 1 MiB chunks for HTTP streaming downloads
+PROGRESS_REFRESH_SECONDS = 1 / 30  # Cap download progress redraws at ~30 Hz
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB buffer for archive member writes and buffered file copies
+ARCHIVE_IN_MEMORY_MAX = 64 << 20  # Template archives up to 64 MiB never touch disk before extraction
+GITHUB_MODELS_CATALOG_URL = "https://models.github.ai/catalog/models"
+_PLACEHOLDER_RE = re.compile(r"\$ARGUMENTS|\{SCRIPT\}")  # Command template placeholders
+_HAS_ALPHA = re.compile(r"[^\W\d_]").search  # Any letter, as str.isalpha sees it
 HTTP_TIMEOUT_SECONDS = 30  # Default timeout for HTTP requests
+HTTP_MAX_KEEPALIVE = 8     # Pooled connections kept open for reuse
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30  # Idle pooled connections survive interactive prompts between requests
+
+# Sent on GitHub REST API calls only; the shared client also downloads release
+# assets from github.com and its CDN, so these are not client-wide defaults.
+_GITHUB_API_HEADERS: Mapping[str, str] = MappingProxyType({
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+})
+
+_http_client: "httpx.Client | None" = None
+_http_client_lock = threading.Lock()
+
+
+def _new_client(verify) -> "httpx.Client":
+    """Build a pooled HTTP/2 client that is closed at interpreter exit."""
+    import httpx
+    client = httpx.Client(
+        verify=verify,
+        http2=True,
+        timeout=HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _get_client() -> "httpx.Client":
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Sharing one HTTP/2 client lets the GitHub API, release asset and models
+    catalog requests reuse pooled connections instead of repeating DNS, TCP
+    and TLS setup for every call.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = _new_client(_get_ssl_context())
+        return _http_client
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write data to a raw file descriptor, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, obj) -> None:
+    """Write obj as compact JSON via a sibling temp file and os.replace.
+
+    Readers see either the previous file or the complete new one, never a
+    truncated write; the per-process temp name keeps concurrent writers apart.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(_json_bytes(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _loads_json(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _read_json(path: Path):
+    """Parse the JSON file at path, using orjson when it is installed."""
+    return _loads_json(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=4)
 def _github_token(cli_token: str | None = None) -> str | None:
-    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    """Return sanitized GitHub token (cli arg takes precedence) or None.
+
+    Resolved once per process; the environment is not re-read on later calls.
+    """
     return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
 
 
-def _github_auth_headers(cli_token: str | None = None) -> dict:
-    """Return Authorization header dict only when a non-empty token exists."""
+@functools.lru_cache(maxsize=4)
+def _github_auth_headers(cli_token: str | None = None) -> Mapping[str, str]:
+    """Return a read-only Authorization header mapping, empty when no token exists."""
     token = _github_token(cli_token)
-    return {"Authorization": f"Bearer {token}"} if token else {}
+    return MappingProxyType({"Authorization": f"Bearer {token}"} if token else {})
 
 
-def _save_models_cache(cache_file: Path, models: dict, source: str) -> None:
+def _save_models_cache(cache_file: Path, models: Mapping[str, str], source: str, etag: str | None = None, last_modified: str | None = None) -> None:
     """
     Centralized cache saving with proper error handling.
 
@@ -82,84 +211,130 @@ def _save_models_cache(cache_file: Path, models: dict, source: str) -> None:
         cache_file: Path to the cache file
         models: Dictionary of model_id -> model_name mappings
         source: Source of the models ("api" or "fallback")
+        etag: ETag of the catalog response, for conditional revalidation
+        last_modified: Last-Modified of the catalog response, likewise
     """
     try:
         cache_file.parent.mkdir(parents=True, exist_ok=True)
         cache_data = {
-            "models": models,
+            "models": dict(models),
             "timestamp": time.time(),
             "source": source,
         }
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        if etag:
+            cache_data["etag"] = etag
+        if last_modified:
+            cache_data["last_modified"] = last_modified
+        _write_json_atomic(cache_file, cache_data)
     except (IOError, OSError, PermissionError):
         # Silently ignore cache write failures - not critical for functionality
         # In debug mode, this could be logged
         pass
 
 
-def fetch_github_models(github_token: str = None, use_cache: bool = True) -> dict:
-    """Fetch available GitHub Models from the API with optional caching."""
-    cache_file = _models_cache_path()
+_models_memo_started = time.monotonic()  # When _fetch_github_models' memo was last cleared
+
+
+def fetch_github_models(github_token: str = None, use_cache: bool = True) -> Mapping[str, str]:
+    """Fetch available GitHub Models from the API with optional caching.
+
+    Results are memoized per process for CACHE_TTL_SECONDS, matching the
+    on-disk cache; clear _fetch_github_models' cache to force a new lookup.
+    use_cache=False skips the memo as well as the disk cache.
+    """
+    global _models_memo_started
+    if not use_cache:
+        return _fetch_github_models.__wrapped__(_github_token(github_token), False)
+    now = time.monotonic()
+    if now - _models_memo_started >= CACHE_TTL_SECONDS:
+        # Long-lived callers fall through to the disk cache and API once the TTL lapses
+        _fetch_github_models.cache_clear()
+        _models_memo_started = now
+    return _fetch_github_models(_github_token(github_token), use_cache)
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_github_models(github_token: str | None, use_cache: bool) -> Mapping[str, str]:
+    import httpx
+
+    cache_file = _MODELS_CACHE_PATH
 
     # Check cache first (if enabled and recent)
-    if use_cache and cache_file.exists():
+    cached_data = None
+    if use_cache:
         try:
-            cache_stat = cache_file.stat()
-            # Use cache if less than CACHE_TTL_SECONDS old
-            if time.time() - cache_stat.st_mtime < CACHE_TTL_SECONDS:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    if cached_data.get("models"):
-                        return cached_data["models"]
+            # A missing file raises OSError
+            st = os.stat(_MODELS_CACHE_FILE)
+            cache_age = time.time() - st.st_mtime
+            cached_data = _read_models_cache(st)
+            if not isinstance(cached_data, dict) or not cached_data.get("models"):
+                cached_data = None
+            elif cache_age < CACHE_TTL_SECONDS:
+                return cached_data["models"]
         except (json.JSONDecodeError, IOError, OSError):
             # Cache read errors should be silently ignored, continue with API fetch
             pass
 
+    headers = {**_GITHUB_API_HEADERS, **_github_auth_headers(github_token)}
+    # Revalidate a stale API catalog instead of downloading it again; a 304
+    # carries no body, so there is nothing to transfer or parse.
+    if cached_data and cached_data.get("source") == "api":
+        if cached_data.get("etag"):
+            headers["If-None-Match"] = cached_data["etag"]
+        if cached_data.get("last_modified"):
+            headers["If-Modified-Since"] = cached_data["last_modified"]
+
     try:
-        with httpx.Client(verify=ssl_context, timeout=10.0) as client:
-            # Fetch from GitHub Models catalog API
-            response = client.get(
-                "https://models.github.ai/catalog/models",
-                headers={
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                    **_github_auth_headers(github_token)
-                }
+        # Fetch from GitHub Models catalog API
+        response = _get_client().get(
+            GITHUB_MODELS_CATALOG_URL,
+            timeout=10.0,
+            headers=headers,
+        )
+        if response.status_code == 304 and cached_data:
+            # Unchanged: restart the TTL and keep the validators for next time
+            _save_models_cache(
+                cache_file, cached_data["models"], cached_data["source"],
+                cached_data.get("etag"), cached_data.get("last_modified"),
             )
-            if response.status_code == 200:
-                models_data = response.json()
-
-                # Combine API results with known GitHub Copilot models
-                api_models = {}
-
-                # Parse the models response and create a clean mapping
-                if isinstance(models_data, list):
-                    for model in models_data:
-                        model_id = model.get("id", "")
-                        model_name = model.get("name", model_id)
-                        if model_id and "/" in model_id:  # Only process valid model IDs with publisher prefix
-                            # Simplify model IDs (e.g., "openai/gpt-4o" -> "gpt-4o")
-                            simple_id = model_id.split("/")[-1]
-                            # Only add if it looks like a valid model ID (contains letters)
-                            if simple_id and any(c.isalpha() for c in simple_id):
-                                api_models[simple_id] = model_name
-
-                # Merge: API models first, then add fallback models (so Copilot-exclusive models are included)
-                fallback_models = get_fallback_github_models()
-                combined_models = {**api_models, **fallback_models}
-
-                # Save to cache for future use
-                if use_cache:
-                    _save_models_cache(cache_file, combined_models, "api" if api_models else "fallback")
-
-                return combined_models
-            else:
-                # Fallback to known models if API fails
-                fallback_only = get_fallback_github_models()
-                if use_cache:
-                    _save_models_cache(cache_file, fallback_only, "fallback")
-                return fallback_only
+            return cached_data["models"]
+        if response.status_code == 200:
+            models_data = response.json()
+
+            # Combine API results with known GitHub Copilot models
+            api_models = {}
+
+            # Parse the models response and create a clean mapping
+            if isinstance(models_data, list):
+                for model in models_data:
+                    model_id = model.get("id", "")
+                    model_name = model.get("name", model_id)
+                    if model_id and "/" in model_id:  # Only process valid model IDs with publisher prefix
+                        # Simplify model IDs (e.g., "openai/gpt-4o" -> "gpt-4o")
+                        simple_id = model_id.rsplit("/", 1)[-1]
+                        # Only add if it looks like a valid model ID (contains letters)
+                        if simple_id and _HAS_ALPHA(simple_id):
+                            api_models[simple_id] = model_name
+
+            # Merge: API models first, then add fallback models (so Copilot-exclusive models are included)
+            source = "api" if api_models else "fallback"
+            combined_models = api_models  # Built locally above, so merge in place
+            combined_models.update(GITHUB_MODEL_FALLBACKS)
+
+            # Save to cache for future use
+            if use_cache:
+                _save_models_cache(
+                    cache_file, combined_models, source,
+                    response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                )
+
+            return combined_models
+        else:
+            # Fallback to known models if API fails
+            fallback_only = get_fallback_github_models()
+            if use_cache:
+                _save_models_cache(cache_file, fallback_only, "fallback")
+            return fallback_only
     except (httpx.RequestError, httpx.HTTPStatusError, json.JSONDecodeError):
         # Fallback to known models if any error occurs during API call
         fallback_only = get_fallback_github_models()
@@ -167,7 +342,7 @@ def fetch_github_models(github_token: str = None, use_cache: bool = True) -> dic
             _save_models_cache(cache_file, fallback_only, "fallback")
         return fallback_only
 
-GITHUB_MODEL_FALLBACKS: dict[str, str] = {
+GITHUB_MODEL_FALLBACKS: Mapping[str, str] = MappingProxyType({
     # OpenAI GPT-4.1 series
     "gpt-4.1": "GPT-4.1",
     "gpt-4.1-mini": "GPT-4.1 Mini",
@@ -209,54 +384,153 @@ GITHUB_MODEL_FALLBACKS: dict[str, str] = {
     # OpenAI embeddings
     "text-embedding-3-large": "Text Embedding 3 Large",
     "text-embedding-3-small": "Text Embedding 3 Small",
-}
-def get_fallback_github_models() -> dict:
-    """Return a curated GitHub Models-only fallback list when the live catalog is unavailable."""
-    return dict(GITHUB_MODEL_FALLBACKS)
+})
+
+
+def get_fallback_github_models() -> Mapping[str, str]:
+    """Return the shared, read-only fallback list used when the live catalog is unavailable."""
+    return GITHUB_MODEL_FALLBACKS
+
+
+# Resolved once. Same directory as Path.home(): $HOME on POSIX (passwd only when
+# unset), USERPROFILE on Windows even under Git Bash/MSYS, which export HOME
+_HOME = os.path.expanduser("~")
+_SPECIFY_HOME = os.path.join(_HOME, ".specify")  # Global cache directory shared by all projects
+_MODELS_CACHE_FILE = os.path.join(_SPECIFY_HOME, "models_cache.json")
+_MODELS_CACHE_PATH = Path(_MODELS_CACHE_FILE)
+_RELEASE_CACHE_PATH = Path(_SPECIFY_HOME, "release_cache.json")
+
+
+_models_cache_memo: tuple[tuple[int, int, int], dict] | None = None  # ((ino, mtime_ns, size), parsed)
+
+
+def _read_models_cache(st: os.stat_result) -> dict:
+    """Parse the models cache described by st, reusing the last parse while the file is unchanged.
+
+    Cache writes replace the file, so a new inode (or mtime/size) marks every
+    rewrite. Callers must not mutate the returned dict.
+    """
+    global _models_cache_memo
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if _models_cache_memo is None or _models_cache_memo[0] != key:
+        _models_cache_memo = (key, _read_json(_MODELS_CACHE_PATH))
+    return _models_cache_memo[1]
+
+
+_SYS_CACHESTAT = 451
+# Machines whose syscall table gives cachestat number 451: the generic table
+# (arm64, riscv, loongarch) plus x86, arm, powerpc and s390. Alpha (561) and
+# the MIPS ABIs (offset by 4000/5000/6000) number it differently.
+_CACHESTAT_451_MACHINE_RE = re.compile(
+    r"x86_64|amd64|i[3-6]86|aarch64|arm64|armv\d+\w*|riscv64|ppc(?:64(?:le)?)?|s390x|loongarch64"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _cachestat_types() -> tuple[type, type]:
+    """Build the cachestat(2) argument structs once; ctypes loads only when cachestat is used."""
+    import ctypes
+
+    class _CachestatRange(ctypes.Structure):
+        _fields_ = [("off", ctypes.c_uint64), ("len", ctypes.c_uint64)]
+
+    class _Cachestat(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_uint64) for name in
+                    ("nr_cache", "nr_dirty", "nr_writeback", "nr_evicted", "nr_recently_evicted")]
+
+    return _CachestatRange, _Cachestat
+
+
+def _kernel_has_cachestat() -> bool:
+    if sys.platform != "linux":
+        return False
+    uname = os.uname()  # uname().machine is what platform.machine() reports
+    if not _CACHESTAT_451_MACHINE_RE.fullmatch(uname.machine):
+        return False
+    release = re.match(r"(\d+)\.(\d+)", uname.release)
+    return release is not None and (int(release[1]), int(release[2])) >= (6, 5)
+
+
+def _page_cache_residency(path: str) -> int | None:
+    """Return the percentage of *path* resident in the page cache via cachestat(2), or None if unsupported."""
+    if not _kernel_has_cachestat():
+        return None
+    import ctypes
+
+    _CachestatRange, _Cachestat = _cachestat_types()
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return 100
+        cstat = _Cachestat()
+        libc = ctypes.CDLL(None, use_errno=True)
+        # A zero length covers the range up to the end of the file
+        if libc.syscall(_SYS_CACHESTAT, fd, ctypes.byref(_CachestatRange(0, 0)), ctypes.byref(cstat), 0) != 0:
+            return None
+    except (OSError, AttributeError):
+        return None
+    finally:
+        os.close(fd)
+    pages = -(-size // os.sysconf("SC_PAGESIZE"))
+    return min(100, cstat.nr_cache * 100 // pages)
 
 
 def _models_cache_path() -> Path:
-    return Path.home() / ".specify" / "models_cache.json"
+    return _MODELS_CACHE_PATH
 
 
 def _load_models_cache_metadata() -> dict | None:
     cache_file = _models_cache_path()
-    if not cache_file.exists():
+    try:
+        # One stat doubles as the existence check
+        st = os.stat(_MODELS_CACHE_FILE)
+    except OSError:
         return None
     try:
-        data = json.loads(cache_file.read_text())
-        data["path"] = str(cache_file)
-        data["age_seconds"] = max(time.time() - cache_file.stat().st_mtime, 0)
+        data = dict(_read_models_cache(st))  # Copied: the parse is shared
+        data["path"] = _MODELS_CACHE_FILE
+        data["age_seconds"] = max(time.time() - st.st_mtime, 0)
         return data
     except (json.JSONDecodeError, IOError, OSError):
         # Return minimal info if cache is corrupted or unreadable
         return {"path": str(cache_file), "age_seconds": None, "corrupt": True}
 
 
+# (upper bound in seconds, seconds per unit, suffix), smallest unit first
+_AGE_BUCKETS = (
+    (60, 1, "s"),
+    (3600, 60, "m"),
+    (86400, 3600, "h"),
+    (604800, 86400, "d"),
+    (float("inf"), 604800, "w"),
+)
+_AGE_LIMITS = tuple(limit for limit, _, _ in _AGE_BUCKETS)
+
+
 def _format_age(seconds: float | None) -> str:
     if seconds is None:
         return "unknown age"
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    minutes = seconds / 60
-    if minutes < 60:
-        return f"{int(minutes)}m"
-    hours = minutes / 60
-    if hours < 24:
-        return f"{int(hours)}h"
-    days = hours / 24
-    if days < 7:
-        return f"{int(days)}d"
-    weeks = days / 7
-    return f"{int(weeks)}w"
+    # First bucket whose upper bound exceeds seconds; the open-ended one catches the rest
+    _, unit, suffix = _AGE_BUCKETS[min(bisect_right(_AGE_LIMITS, seconds), len(_AGE_BUCKETS) - 1)]
+    return f"{int(seconds / unit)}{suffix}"
+
 
+def _format_cache_age(seconds: int) -> str:
+    """Render a whole-second age as minutes below an hour, hours otherwise."""
+    return f"{seconds // 60} minutes" if seconds < 3600 else f"{seconds // 3600} hours"
 
+
+@functools.lru_cache(maxsize=256)
 def _parse_iso8601(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        cleaned = value.rstrip("Z") + "+00:00" if value.endswith("Z") else value
-        dt = datetime.fromisoformat(cleaned)
+        # Python 3.11+ parses a trailing "Z" itself; no offset rewriting needed
+        dt = datetime.fromisoformat(value)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
@@ -265,25 +539,46 @@ def _parse_iso8601(value: str | None) -> datetime | None:
         return None
 
 
+def _iso_z(dt: datetime) -> str:
+    """Format a UTC datetime from _parse_iso8601 as ISO 8601 with a "Z" suffix."""
+    # The offset is always "+00:00" here; slicing it off beats a replace() scan
+    return dt.isoformat()[:-6] + "Z"
+
+
 EM_DASH = "—"
 
 
 def _read_first_markdown_heading(path: Path) -> str | None:
     """Return the first Markdown heading in a file, if present."""
-    if not path.exists():
-        return None
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    return stripped.lstrip("# ").strip()
-    except (IOError, OSError, UnicodeDecodeError):
-        # File read errors or encoding issues
+        with open(path, "rb") as handle:
+            # Headings nearly always sit in the first block; only decode the matching line
+            pending = b""
+            while chunk := handle.read(4096):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    heading = _markdown_heading(line)
+                    if heading is not None:
+                        return heading
+            return _markdown_heading(pending)
+    except (IOError, OSError):
+        # Missing or unreadable file
         return None
+
+
+def _markdown_heading(line: bytes) -> str | None:
+    stripped = line.strip().removeprefix(b"\xef\xbb\xbf")  # Tolerate a UTF-8 BOM
+    if stripped.startswith(b"#"):
+        return stripped.decode("utf-8", errors="replace").lstrip("# ").strip()
     return None
 
 
+# Next workflow command for each (spec, plan, tasks) presence combination,
+# indexed by spec << 2 | plan << 1 | tasks: the first missing stage wins.
+_NEXT_COMMAND_BY_MASK = ("specify",) * 4 + ("plan", "plan", "tasks", "implement")
+
+
 def _collect_workflow_artifacts(specify_dir: Path) -> dict:
     """
     Inspect key workflow artifacts in a Specify workspace.
@@ -306,53 +601,57 @@ def _collect_workflow_artifacts(specify_dir: Path) -> dict:
             - waiting_tasks (list[dict]): Features needing tasks
             - missing_spec (list[dict]): Features without specs
     """
-    constitution_path = specify_dir / "memory" / "constitution.md"
-    constitution_exists = constitution_path.exists()
+    constitution_exists = os.path.isfile(os.path.join(specify_dir, "memory", "constitution.md"))
 
     specs_root = specify_dir / "specs"
     features: list[dict] = []
+    specs_ready = plans_ready = tasks_ready = 0
+    waiting_plan: list[dict] = []
+    waiting_tasks: list[dict] = []
+    missing_spec: list[dict] = []
 
-    if specs_root.exists():
-        for feature_dir in sorted(specs_root.iterdir(), key=lambda p: p.name):
-            if not feature_dir.is_dir():
-                continue
-            spec_path = feature_dir / "spec.md"
-            plan_path = feature_dir / "plan.md"
-            tasks_path = feature_dir / "tasks.md"
-
-            spec_exists = spec_path.exists()
-            plan_exists = plan_path.exists()
-            tasks_exists = tasks_path.exists()
-
-            if not spec_exists:
-                next_command = "specify"
-            elif not plan_exists:
-                next_command = "plan"
-            elif not tasks_exists:
-                next_command = "tasks"
-            else:
-                next_command = "implement"
-
-            features.append(
-                {
-                    "path": str(feature_dir),
-                    "slug": feature_dir.name,
-                    "spec": spec_exists,
-                    "plan": plan_exists,
-                    "tasks": tasks_exists,
-                    "title": _read_first_markdown_heading(spec_path) if spec_exists else None,
-                    "next_command": next_command,
-                    "ready_for_implementation": next_command == "implement",
-                }
-            )
-
-    specs_ready = sum(1 for feature in features if feature["spec"])
-    plans_ready = sum(1 for feature in features if feature["plan"])
-    tasks_ready = sum(1 for feature in features if feature["tasks"])
+    try:
+        with os.scandir(specs_root) as it:
+            feature_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+    except OSError:
+        feature_dirs = []
 
-    waiting_plan = [feature for feature in features if feature["spec"] and not feature["plan"]]
-    waiting_tasks = [feature for feature in features if feature["plan"] and not feature["tasks"]]
-    missing_spec = [feature for feature in features if not feature["spec"]]
+    for feature_dir in feature_dirs:
+        # One directory read answers all three existence checks
+        try:
+            with os.scandir(feature_dir.path) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
+        spec_exists = "spec.md" in names
+        plan_exists = "plan.md" in names
+        tasks_exists = "tasks.md" in names
+
+        next_command = _NEXT_COMMAND_BY_MASK[spec_exists << 2 | plan_exists << 1 | tasks_exists]
+
+        feature = {
+            "path": feature_dir.path,
+            "slug": feature_dir.name,
+            "spec": spec_exists,
+            "plan": plan_exists,
+            "tasks": tasks_exists,
+            "title": _read_first_markdown_heading(Path(feature_dir.path, "spec.md")) if spec_exists else None,
+            "next_command": next_command,
+            "ready_for_implementation": next_command == "implement",
+        }
+        feature["display_name"] = _feature_display_name(feature)
+        features.append(feature)
+
+        # Tally progress in the same pass instead of re-walking features
+        specs_ready += spec_exists
+        plans_ready += plan_exists
+        tasks_ready += tasks_exists
+        if not spec_exists:
+            missing_spec.append(feature)
+        elif not plan_exists:
+            waiting_plan.append(feature)
+        if plan_exists and not tasks_exists:
+            waiting_tasks.append(feature)
 
     return {
         "constitution": constitution_exists,
@@ -377,6 +676,9 @@ def _feature_display_name(feature: dict) -> str:
     Returns:
         Formatted display name (e.g., "my-feature · My Feature Title")
     """
+    cached = feature.get("display_name")
+    if cached is not None:
+        return cached
     title = feature.get("title") or ""
     slug = feature.get("slug") or ""
     if title and title.lower() != slug.lower():
@@ -384,6 +686,12 @@ def _feature_display_name(feature: dict) -> str:
     return slug or title or "feature"
 
 
+def _first_n_names(features: list[dict], n: int = 3) -> str:
+    """Join the display names of the first n features, adding an ellipsis if more remain."""
+    names = ", ".join(_feature_display_name(feature) for feature in features[:n])
+    return names + ", …" if len(features) > n else names
+
+
 def _format_stage_progress(completed: int, total: int) -> str:
     """
     Format a progress indicator for workflow stages.
@@ -432,30 +740,17 @@ def _derive_followups(summary: dict) -> list[str]:
     if specs_ready == 0:
         followups.append("Kick off your first feature with [magenta]/specify[/magenta].")
     if summary.get("missing_spec"):
-        missing = summary["missing_spec"]
-        names = ", ".join(_feature_display_name(feature) for feature in missing[:3])
-        if len(missing) > 3:
-            names += ", …"
-        followups.append(f"Finish draft specs for: {names}.")
+        followups.append(f"Finish draft specs for: {_first_n_names(summary['missing_spec'])}.")
     if summary.get("waiting_plan"):
-        waiting_plan = summary["waiting_plan"]
-        names = ", ".join(_feature_display_name(feature) for feature in waiting_plan[:3])
-        if len(waiting_plan) > 3:
-            names += ", …"
-        followups.append(f"Plan next steps with [magenta]/plan[/magenta] → {names}.")
+        followups.append(f"Plan next steps with [magenta]/plan[/magenta] → {_first_n_names(summary['waiting_plan'])}.")
     if summary.get("waiting_tasks"):
-        waiting_tasks = summary["waiting_tasks"]
-        names = ", ".join(_feature_display_name(feature) for feature in waiting_tasks[:3])
-        if len(waiting_tasks) > 3:
-            names += ", …"
-        followups.append(f"Create execution tasks via [magenta]/tasks[/magenta] → {names}.")
+        followups.append(
+            f"Create execution tasks via [magenta]/tasks[/magenta] → {_first_n_names(summary['waiting_tasks'])}."
+        )
 
     ready_for_impl = [feature for feature in summary.get("features", []) if feature.get("ready_for_implementation")]
     if ready_for_impl:
-        names = ", ".join(_feature_display_name(feature) for feature in ready_for_impl[:3])
-        if len(ready_for_impl) > 3:
-            names += ", …"
-        followups.append(f"Move into delivery with [magenta]/implement[/magenta] → {names}.")
+        followups.append(f"Move into delivery with [magenta]/implement[/magenta] → {_first_n_names(ready_for_impl)}.")
 
     return followups
 
@@ -481,17 +776,23 @@ def _pick_primary_suggestion(summary: dict) -> str | None:
     return "Start your first feature with [magenta]/specify[/magenta]."
 
 
-def _render_workflow_summary(summary: dict) -> None:
-    """
-    Display formatted workflow artifacts summary table.
+# Static workflow table cells, parsed from markup once at import rather than on every render
+_STAGE_CELL_DONE = Text.from_markup("[green]✓[/green]")
+_STAGE_CELL_PENDING = Text.from_markup("[yellow]○[/yellow]")
+_WAITING_FOR_SPECS = Text.from_markup("[dim]Waiting for specs[/dim]")
+_WAITING_FOR_PLANS = Text.from_markup("[dim]Waiting for plans[/dim]")
+_RUN_PLAN_AFTER_SPECIFY = Text.from_markup("Run [magenta]/plan[/magenta] after [magenta]/specify[/magenta]")
+_RUN_TASKS_AFTER_PLAN = Text.from_markup("Run [magenta]/tasks[/magenta] after [magenta]/plan[/magenta]")
 
-    Shows the status of constitution, specs, plans, and tasks with
-    next-step guidance for incomplete stages.
+# (status, next step) cells for the constitution row, keyed by whether it exists
+_CONSTITUTION_CELLS = {
+    True: ("[green]✓ Recorded[/green]", EM_DASH),
+    False: ("[yellow]Missing[/yellow]", "Run [magenta]/constitution[/magenta] in Copilot Chat"),
+}
 
-    Args:
-        summary: Workflow artifact summary containing stage completion data
-    """
-    console.print()
+
+def _workflow_table() -> Table:
+    """Return an empty workflow artifacts table with its columns in place."""
     table = Table(
         title="Workflow Artifacts",
         box=box.SIMPLE_HEAVY,
@@ -502,14 +803,35 @@ def _render_workflow_summary(summary: dict) -> None:
     table.add_column("Stage", style="cyan", no_wrap=True)
     table.add_column("Status", style="white")
     table.add_column("Next Step", style="magenta")
+    return table
 
-    constitution_status = (
-        "[green]✓ Recorded[/green]" if summary["constitution"] else "[yellow]Missing[/yellow]"
-    )
-    constitution_next = (
-        EM_DASH if summary["constitution"] else "Run [magenta]/constitution[/magenta] in Copilot Chat"
-    )
-    table.add_row("Constitution", constitution_status, constitution_next)
+
+def _feature_table() -> Table:
+    """Return an empty feature progress table with its columns in place."""
+    table = Table(box=box.SIMPLE, show_header=True, show_edge=True)
+    table.add_column("Feature", style="cyan", no_wrap=True)
+    table.add_column("Spec", justify="center")
+    table.add_column("Plan", justify="center")
+    table.add_column("Tasks", justify="center")
+    table.add_column("Next Action", style="magenta")
+    return table
+
+
+def _render_workflow_summary(summary: dict) -> Group:
+    """
+    Build the formatted workflow artifacts summary table.
+
+    Shows the status of constitution, specs, plans, and tasks with
+    next-step guidance for incomplete stages.
+
+    Args:
+        summary: Workflow artifact summary containing stage completion data
+
+    Returns:
+        Renderable group for the caller to print
+    """
+    table = _workflow_table()
+    table.add_row("Constitution", *_CONSTITUTION_CELLS[bool(summary["constitution"])])
 
     feature_total = summary["feature_total"]
     specs_ready = summary["specs_ready"]
@@ -537,7 +859,7 @@ def _render_workflow_summary(summary: dict) -> None:
     plans_ready = summary["plans_ready"]
     plan_total = specs_ready if specs_ready else 0
     if specs_ready == 0:
-        plans_status = "[dim]Waiting for specs[/dim]"
+        plans_status = _WAITING_FOR_SPECS
     else:
         plans_status = _format_stage_progress(plans_ready, plan_total)
     if summary["waiting_plan"]:
@@ -546,13 +868,13 @@ def _render_workflow_summary(summary: dict) -> None:
     elif plans_ready:
         plans_next = EM_DASH
     else:
-        plans_next = "Run [magenta]/plan[/magenta] after [magenta]/specify[/magenta]"
+        plans_next = _RUN_PLAN_AFTER_SPECIFY
     table.add_row("Plans", plans_status, plans_next)
 
     tasks_ready = summary["tasks_ready"]
     tasks_total = plans_ready if plans_ready else 0
     if plans_ready == 0:
-        tasks_status = "[dim]Waiting for plans[/dim]"
+        tasks_status = _WAITING_FOR_PLANS
     else:
         tasks_status = _format_stage_progress(tasks_ready, tasks_total)
     if summary["waiting_tasks"]:
@@ -561,20 +883,18 @@ def _render_workflow_summary(summary: dict) -> None:
     elif tasks_ready:
         tasks_next = EM_DASH
     else:
-        tasks_next = "Run [magenta]/tasks[/magenta] after [magenta]/plan[/magenta]"
+        tasks_next = _RUN_TASKS_AFTER_PLAN
     table.add_row("Tasks", tasks_status, tasks_next)
 
-    console.print(table)
-
+    parts: list[RenderableType] = ["", table]
     followups = _derive_followups(summary)
     if followups:
-        console.print()
-        console.print("[dim]Next suggestions:[/dim]")
-        for item in followups:
-            console.print(f"  • {item}")
+        parts += ("", "[dim]Next suggestions:[/dim]")
+        parts.extend(f"  • {item}" for item in followups)
+    return Group(*parts)
 
 
-def _format_stage_cell(flag: bool) -> str:
+def _format_stage_cell(flag: bool) -> Text:
     """
     Format a table cell showing stage completion status.
 
@@ -584,7 +904,15 @@ def _format_stage_cell(flag: bool) -> str:
     Returns:
         Colored checkmark (✓) for complete, circle (○) for incomplete
     """
-    return "[green]✓[/green]" if flag else "[yellow]○[/yellow]"
+    return _STAGE_CELL_DONE if flag else _STAGE_CELL_PENDING
+
+
+_NEXT_ACTION_LABELS = {
+    "specify": "Draft with [magenta]/specify[/magenta]",
+    "plan": "Plan via [magenta]/plan[/magenta]",
+    "tasks": "Task with [magenta]/tasks[/magenta]",
+    "implement": "Ready for [magenta]/implement[/magenta]",
+}
 
 
 def _next_action_label(feature: dict) -> str:
@@ -597,41 +925,30 @@ def _next_action_label(feature: dict) -> str:
     Returns:
         Formatted command suggestion or em dash if none needed
     """
-    mapping = {
-        "specify": "Draft with [magenta]/specify[/magenta]",
-        "plan": "Plan via [magenta]/plan[/magenta]",
-        "tasks": "Task with [magenta]/tasks[/magenta]",
-        "implement": "Ready for [magenta]/implement[/magenta]",
-    }
-    return mapping.get(feature.get("next_command"), EM_DASH)
+    return _NEXT_ACTION_LABELS.get(feature.get("next_command"), EM_DASH)
 
 
-def _render_feature_details(summary: dict) -> None:
+def _render_feature_details(summary: dict) -> Group:
     """
-    Display detailed feature progress table.
+    Build the detailed feature progress table.
 
     Shows up to 5 features with their spec/plan/tasks completion status
     and suggested next action for each feature.
 
     Args:
         summary: Workflow artifact summary with feature list
+
+    Returns:
+        Renderable group for the caller to print
     """
     features = summary.get("features") or []
     if not features:
-        console.print()
-        console.print("[dim]No feature folders yet. Use [magenta]/specify[/magenta] to start your first feature.[/dim]")
-        return
-
-    console.print()
-    console.print("[bold]Feature Progress[/bold]")
-
-    table = Table(box=box.SIMPLE, show_header=True, show_edge=True)
-    table.add_column("Feature", style="cyan", no_wrap=True)
-    table.add_column("Spec", justify="center")
-    table.add_column("Plan", justify="center")
-    table.add_column("Tasks", justify="center")
-    table.add_column("Next Action", style="magenta")
+        return Group(
+            "",
+            "[dim]No feature folders yet. Use [magenta]/specify[/magenta] to start your first feature.[/dim]",
+        )
 
+    table = _feature_table()
     for feature in features[:5]:
         feature_name = _feature_display_name(feature)
         table.add_row(
@@ -642,12 +959,12 @@ def _render_feature_details(summary: dict) -> None:
             _next_action_label(feature),
         )
 
-    console.print(table)
-
+    parts: list[RenderableType] = ["", "[bold]Feature Progress[/bold]", table]
     if len(features) > 5:
-        console.print(
+        parts.append(
             f"[dim]Showing first 5 of {len(features)} features. Run with --json to see the full list.[/dim]"
         )
+    return Group(*parts)
 
 # Constants
 WORKSPACE_DOT_DIRS = (".github", ".vscode", ".specify")
@@ -656,12 +973,34 @@ AI_CHOICES = {
 }
 # Add script type choices
 SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
+_IS_WINDOWS = os.name == "nt"
+_PY_VERSION = sys.version.partition(" ")[0]
+_DEFAULT_SCRIPT = "ps" if _IS_WINDOWS else "sh"
+# Pre-joined for the validation error messages in init
+_AI_CHOICES_STR = ", ".join(AI_CHOICES)
+_SCRIPT_CHOICES_STR = ", ".join(SCRIPT_TYPE_CHOICES)
+_FIRST_AI_CHOICE = next(iter(AI_CHOICES))  # Auto-selected when it is the only assistant
+
+# Folder each agent keeps its files in, named in init's security notice
+AGENT_FOLDER_MAP = {
+    "copilot": ".github/",
+}
 
 # Agent configurations for setup (directory, format, arg placeholder)
 agent_configs = {
     "copilot": {"dir": ".github/prompts", "format": "prompt.md", "arg_placeholder": "$ARGUMENTS"},
 }
 
+# Scripts folder and file extension for each script flavor
+_SCRIPT_FOLDERS = {"ps": "powershell", "sh": "bash"}
+_SCRIPT_EXTENSIONS = {"ps": "ps1", "sh": "sh"}
+
+# Source checkout layout used by `init --local` (src/specify_cli -> repository root)
+_DEV_ROOT = Path(__file__).parent.parent.parent
+_DEV_TEMPLATES_DIR = _DEV_ROOT / "templates"
+_DEV_MEMORY_DIR = _DEV_ROOT / "memory"
+_DEV_SCRIPTS_DIR = _DEV_ROOT / "scripts"
+
 
 
 # ASCII Art Banner
@@ -680,23 +1019,49 @@ BANNER = r"""
 """
 
 TAGLINE = "GitHub Spec Kit - Spec-Driven Development Toolkit"
+class TrackerStep:
+    """A single StepTracker entry; slotted to keep per-step state compact and attribute access cheap."""
+    __slots__ = ("key", "label", "status", "detail")
+
+    def __init__(self, key: str, label: str, status: str = "pending", detail: str = ""):
+        self.key = key
+        self.label = label
+        self.status = status
+        self.detail = detail
+
+
+# Circles shown in front of each StepTracker line, by step status
+_STATUS_SYMBOLS = {
+    "done": "[green]●[/green]",
+    "pending": "[green dim]○[/green dim]",
+    "running": "[cyan]○[/cyan]",
+    "error": "[red]●[/red]",
+    "skipped": "[yellow]○[/yellow]",
+}
+
+
 class StepTracker:
     """Track and render hierarchical steps without emojis in a clean tree format.
-    Supports live auto-refresh via an attached refresh callback.
+    Supports live auto-refresh via an attached refresh callback, or can be
+    handed to rich.live.Live directly, which then polls it at its own
+    refresh rate no matter how often steps change.
     """
     def __init__(self, title: str):
         self.title = title
-        self.steps = []  # list of dicts: {key, label, status, detail}
+        self.steps: list[TrackerStep] = []
+        self._index: dict[str, TrackerStep] = {}  # key -> step, for O(1) lookups
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
         self._refresh_cb = None  # callable to trigger UI refresh
+        self._cached_tree = None  # last rendered Tree, reused until a step changes
+        self._line_cache: dict[tuple[str, str, str], str] = {}
+        self._lock = threading.RLock()  # Live renders from its refresh thread
 
     def attach_refresh(self, cb):
         self._refresh_cb = cb
 
     def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
+        if key not in self._index:
+            self._append(TrackerStep(key, label))
 
     def start(self, key: str, detail: str = ""):
         self._update(key, status="running", detail=detail)
@@ -710,16 +1075,26 @@ class StepTracker:
     def skip(self, key: str, detail: str = ""):
         self._update(key, status="skipped", detail=detail)
 
+    def _append(self, step: TrackerStep):
+        with self._lock:
+            self.steps.append(step)
+            self._index[step.key] = step
+            self._cached_tree = None
+        self._maybe_refresh()
+
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
+        with self._lock:
+            s = self._index.get(key)
+            if s is None:
+                # If not present, add it
+                self._append(TrackerStep(key, key, status, detail))
                 return
-        # If not present, add it
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
+            if s.status == status and (not detail or s.detail == detail):
+                return  # nothing visible changed; skip the re-render
+            s.status = status
+            if detail:
+                s.detail = detail
+            self._cached_tree = None
         self._maybe_refresh()
 
     def _maybe_refresh(self):
@@ -731,42 +1106,46 @@ class StepTracker:
                 # Common errors: Live context already stopped, display issues
                 pass
 
-    def render(self):
-        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-
-            # Circles (unchanged styling)
-            status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
+    def _format_line(self, label: str, status: str, detail: str) -> str:
+        cache_key = (status, label, detail)
+        line = self._line_cache.get(cache_key)
+        if line is not None:
+            return line
 
-            if status == "pending":
-                # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
+        detail_text = detail.strip() if detail else ""
+
+        symbol = _STATUS_SYMBOLS.get(status, " ")
+
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
             else:
-                # Label white, detail (if any) light gray in parentheses
-                if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
+                line = f"{symbol} [bright_black]{label}[/bright_black]"
+        else:
+            # Label white, detail (if any) light gray in parentheses
+            if detail_text:
+                line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+            else:
+                line = f"{symbol} [white]{label}[/white]"
+
+        self._line_cache[cache_key] = line
+        return line
+
+    def render(self):
+        with self._lock:
+            if self._cached_tree is not None:
+                return self._cached_tree
+            from rich.tree import Tree
 
-            tree.add(line)
-        return tree
+            tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+            for step in self.steps:
+                tree.add(self._format_line(step.label, step.status, step.detail))
+            self._cached_tree = tree
+            return tree
+
+    def __rich__(self):
+        return self.render()
 
 
 
@@ -786,6 +1165,8 @@ MINI_BANNER = r"""
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
 
     # Arrow keys
@@ -809,6 +1190,65 @@ def get_key():
     return key
 
 
+# Key names for the byte sequences a POSIX terminal sends in cbreak mode
+_POSIX_KEYS = {
+    "\x1b[A": "up", "\x1bOA": "up", "\x10": "up",
+    "\x1b[B": "down", "\x1bOB": "down", "\x0e": "down",
+    "\r": "enter", "\n": "enter",
+    "\x1b": "escape",
+}
+_KEY_TOKEN_RE = re.compile(r"\x1b(?:[\[O][0-9;]*[A-Za-z~])?|.", re.DOTALL)
+# An escape sequence cut off at the end of a read: ESC, ESC [, ESC O, or CSI parameters
+_PARTIAL_ESCAPE_RE = re.compile(rb"\x1b(?:[\[O][0-9;]*)?\Z")
+# How long to wait for the rest of a split sequence; a lone Esc press costs this much
+_ESCAPE_SEQUENCE_TIMEOUT = 0.1
+
+
+def _decode_key_burst(data: bytes) -> list[str]:
+    """Split raw terminal input into key names ("up", "enter", ...) or literal characters."""
+    tokens = _KEY_TOKEN_RE.findall(data.decode("utf-8", errors="replace"))
+    return [_POSIX_KEYS.get(token, token) for token in tokens]
+
+
+def _read_key_burst() -> list[str]:
+    """Block for the next keypress, then return it with every key already queued behind it.
+
+    Held arrow keys arrive faster than a panel redraw; draining them lets the
+    caller apply the whole burst and refresh once.
+    """
+    if _IS_WINDOWS:
+        import msvcrt
+        keys = [get_key()]
+        while msvcrt.kbhit():
+            keys.append(get_key())
+        return keys
+
+    import select
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        # TCSANOW keeps type-ahead; readchar's TCSAFLUSH would discard it
+        tty.setcbreak(fd, termios.TCSANOW)
+        data = os.read(fd, 1024)
+        while data:
+            # Over SSH or a slow PTY an arrow's bytes can arrive in two reads; wait
+            # briefly for the tail so a split "\x1b[A" is not taken as Esc
+            timeout = _ESCAPE_SEQUENCE_TIMEOUT if _PARTIAL_ESCAPE_RE.search(data) else 0
+            if not select.select([fd], [], [], timeout)[0]:
+                break
+            chunk = os.read(fd, 1024)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    if not data:
+        return ["escape"]  # stdin closed; nothing more can be selected
+    return _decode_key_burst(data)
+
 
 def select_with_arrows(options: dict, prompt_text: str = "Select an option", default_key: str = None) -> str:
     """
@@ -830,60 +1270,60 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
         if default_key and default_key in options:
             console.print(f"[dim]Non-interactive mode: using default '{default_key}'[/dim]")
             return default_key
-        first_key = list(options.keys())[0]
+        first_key = next(iter(options))
         console.print(f"[dim]Non-interactive mode: using '{first_key}'[/dim]")
         return first_key
 
-    option_keys = list(options.keys())
-    if default_key and default_key in option_keys:
-        selected_index = option_keys.index(default_key)
-    else:
-        selected_index = 0
+    option_keys = list(options)
+    # Dict membership is O(1); only a valid default pays for the index scan
+    selected_index = option_keys.index(default_key) if default_key and default_key in options else 0
 
     selected_key = None
-
-    def create_selection_panel():
-        """Create the selection panel with current selection highlighted."""
-        table = Table.grid(padding=(0, 2))
-        table.add_column(style="cyan", justify="left", width=3)
-        table.add_column(style="white", justify="left")
-
-        for i, key in enumerate(option_keys):
-            if i == selected_index:
-                table.add_row("▶", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
-            else:
-                table.add_row(" ", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
-
-        table.add_row("", "")
-        table.add_row("", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
-
-        return Panel(
-            table,
-            title=f"[bold]{prompt_text}[/bold]",
-            border_style="cyan",
-            padding=(1, 2)
-        )
+    # Options are static, so the panel is built once; moving the selection
+    # only swaps the marker text of the two affected rows
+    markers = [Text(" ") for _ in option_keys]
+    markers[selected_index].plain = "▶"
+    table = Table.grid(padding=(0, 2))
+    table.add_column(style="cyan", justify="left", width=3)
+    table.add_column(style="white", justify="left")
+    for marker, key in zip(markers, option_keys):
+        table.add_row(marker, Text.from_markup(f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]"))
+    table.add_row("", "")
+    table.add_row("", Text.from_markup("[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]"))
+    selection_panel = Panel(
+        table,
+        title=f"[bold]{prompt_text}[/bold]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
 
     console.print()
 
+    from rich.live import Live
+
     def run_selection_loop():
         nonlocal selected_key, selected_index
-        with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
-            while True:
+        with Live(selection_panel, console=console, transient=True, auto_refresh=False) as live:
+            while selected_key is None:
                 try:
-                    key = get_key()
-                    if key == 'up':
-                        selected_index = (selected_index - 1) % len(option_keys)
-                    elif key == 'down':
-                        selected_index = (selected_index + 1) % len(option_keys)
-                    elif key == 'enter':
-                        selected_key = option_keys[selected_index]
-                        break
-                    elif key == 'escape':
-                        console.print("\n[yellow]Selection cancelled[/yellow]")
-                        raise typer.Exit(1)
-
-                    live.update(create_selection_panel(), refresh=True)
+                    previous_index = selected_index
+                    # Apply a whole auto-repeat burst, then redraw once
+                    for key in _read_key_burst():
+                        if key == 'up':
+                            selected_index = (selected_index - 1) % len(option_keys)
+                        elif key == 'down':
+                            selected_index = (selected_index + 1) % len(option_keys)
+                        elif key == 'enter':
+                            selected_key = option_keys[selected_index]
+                            break
+                        elif key == 'escape':
+                            console.print("\n[yellow]Selection cancelled[/yellow]")
+                            raise typer.Exit(1)
+
+                    if selected_key is None and selected_index != previous_index:
+                        markers[previous_index].plain = " "
+                        markers[selected_index].plain = "▶"
+                        live.refresh()
 
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Selection cancelled[/yellow]")
@@ -901,6 +1341,13 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
 
 console = Console()
+# (bold, cyan, dim, reset) escape codes for plain-text output. Follows the
+# console's terminal, NO_COLOR and legacy Windows console detection.
+_ANSI_STYLES = (
+    ("\033[1m", "\033[36m", "\033[2m", "\033[0m")
+    if console.is_terminal and not console.no_color and not console.legacy_windows
+    else ("", "", "", "")
+)
 
 
 class BannerGroup(TyperGroup):
@@ -921,19 +1368,19 @@ app = typer.Typer(
 )
 
 
-def show_banner():
-    """Display the ASCII art banner."""
-    # Create gradient effect with different colors
-    banner_lines = BANNER.strip().split('\n')
-    colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
+# Gradient banner and tagline are static, so build their renderables once
+_BANNER_COLORS = ("bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white")
+_BANNER_RENDERABLE = Align.center(Text.assemble(*(
+    (line + "\n", _BANNER_COLORS[i % len(_BANNER_COLORS)])
+    for i, line in enumerate(BANNER.strip().split("\n"))
+)))
+_TAGLINE_RENDERABLE = Align.center(Text(TAGLINE, style="italic bright_yellow"))
 
-    styled_banner = Text()
-    for i, line in enumerate(banner_lines):
-        color = colors[i % len(colors)]
-        styled_banner.append(line + "\n", style=color)
 
-    console.print(Align.center(styled_banner))
-    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+def show_banner():
+    """Display the ASCII art banner."""
+    console.print(_BANNER_RENDERABLE)
+    console.print(_TAGLINE_RENDERABLE)
     console.print()
 
 
@@ -967,9 +1414,15 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
         return None
 
 
+@functools.lru_cache(maxsize=64)
+def _which(tool: str) -> str | None:
+    """shutil.which, memoized so repeated checks don't rescan PATH."""
+    return shutil.which(tool)
+
+
 def check_tool_for_tracker(tool: str, tracker: StepTracker) -> bool:
     """Check if a tool is installed and update tracker."""
-    if shutil.which(tool):
+    if _which(tool):
         tracker.complete(tool, "available")
         return True
     else:
@@ -979,12 +1432,26 @@ def check_tool_for_tracker(tool: str, tracker: StepTracker) -> bool:
 
 def check_tool(tool: str, install_hint: str) -> bool:
     """Check if a tool is installed."""
-    if shutil.which(tool):
+    if _which(tool):
         return True
     else:
         return False
 
 
+@functools.lru_cache(maxsize=32)
+def _find_git_worktree(resolved: str) -> Path | None:
+    """Return the nearest directory at or above resolved holding a .git entry.
+
+    A .git directory, or a .git file for worktrees and submodules, answers the
+    common case without spawning git. init_git_repo clears this memo.
+    """
+    start = Path(resolved)
+    for parent in (start, *start.parents):
+        if os.path.lexists(parent / ".git"):
+            return parent
+    return None
+
+
 def is_git_repo(path: Path = None) -> bool:
     """Check if the specified path is inside a git repository."""
     if path is None:
@@ -993,12 +1460,20 @@ def is_git_repo(path: Path = None) -> bool:
     if not path.is_dir():
         return False
 
+    if _find_git_worktree(str(path.resolve())) is not None:
+        return True
+    # Only GIT_DIR/GIT_WORK_TREE can make git see a repo the walk missed
+    if "GIT_DIR" not in os.environ and "GIT_WORK_TREE" not in os.environ:
+        return False
+
     try:
         # Use git command to check if inside a work tree
         subprocess.run(  # nosec B603,B607 - git is a required dependency, input is controlled
             ["git", "rev-parse", "--is-inside-work-tree"],
             check=True,
-            capture_output=True,
+            # Only the exit status matters
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=path,
         )
         return True
@@ -1010,14 +1485,18 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
     """Initialize a git repository in the specified path.
     quiet: if True suppress console output (tracker handles status)
     """
+    _find_git_worktree.cache_clear()
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True)  # nosec B603,B607 - git is required, no user input
-        subprocess.run(["git", "add", "."], check=True, capture_output=True)  # nosec B603,B607 - git is required, no user input
-        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True)  # nosec B603,B607 - git is required, hardcoded message
+        # stdout is never read; stderr is kept so CalledProcessError carries git's message
+        quiet_io = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+        # A fresh template tree needs no auto-gc or fsmonitor daemon. Commit hooks
+        # still run: with --here the commit also stages the user's own files
+        git = ["git", "-c", "gc.auto=0", "-c", "core.fsmonitor=false"]
+        subprocess.run([*git, "init", "-q"], check=True, cwd=project_path, **quiet_io)  # nosec B603,B607 - git is required, no user input
+        subprocess.run([*git, "add", "-A", "."], check=True, cwd=project_path, **quiet_io)  # nosec B603,B607 - git is required, no user input
+        subprocess.run([*git, "commit", "-q", "-m", "Initial commit from Specify template"], check=True, cwd=project_path, **quiet_io)  # nosec B603,B607 - git is required, hardcoded message
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True
@@ -1026,22 +1505,76 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
 
 
-def fetch_latest_release_metadata(client: httpx.Client, github_token: str | None = None, debug: bool = False) -> dict:
+def _release_cache_path() -> Path:
+    return _RELEASE_CACHE_PATH
+
+
+def _load_release_cache(cache_file: Path, api_url: str) -> dict | None:
+    """Return the cached release entry for api_url, or None if absent or unreadable."""
+    try:
+        cached = _read_json(cache_file)
+    except (json.JSONDecodeError, IOError, OSError):
+        return None
+    if not isinstance(cached, dict) or cached.get("url") != api_url or not cached.get("release"):
+        return None
+    return cached
+
+
+def _save_release_cache(cache_file: Path, api_url: str, response: "httpx.Response", release_data: dict) -> None:
+    """
+    Persist the release payload with its HTTP validators for conditional requests.
+
+    Args:
+        cache_file: Path to the cache file
+        api_url: Release endpoint the payload was fetched from
+        response: Response carrying the ETag / Last-Modified headers
+        release_data: Parsed release JSON
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_data = {
+            "url": api_url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "release": release_data,
+        }
+        _write_json_atomic(cache_file, cache_data)
+    except (IOError, OSError, PermissionError):
+        # Cache write failures only cost a full download next time
+        pass
+
+
+def fetch_latest_release_metadata(client: "httpx.Client", github_token: str | None = None, debug: bool = False) -> dict:
     repo_owner = "FractionEstate"
     repo_name = "development-spec-kit"
     api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
 
+    # Revalidate the cached release instead of downloading it again; a 304
+    # carries no body and does not count against the API rate limit.
+    cache_file = _release_cache_path()
+    cached = _load_release_cache(cache_file, api_url)
+    headers = {**_GITHUB_API_HEADERS, **_github_auth_headers(github_token)}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     response = client.get(
         api_url,
         timeout=30,
         follow_redirects=True,
-        headers=_github_auth_headers(github_token),
+        headers=headers,
     )
     status = response.status_code
+    if status == 304 and cached:
+        return cached["release"]
     if status != 200:
         msg = f"GitHub API returned {status} for {api_url}"
         if debug:
@@ -1051,18 +1584,54 @@ def fetch_latest_release_metadata(client: httpx.Client, github_token: str | None
         release_data = response.json()
     except ValueError as je:
         raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+    _save_release_cache(cache_file, api_url, response, release_data)
     return release_data
 
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
+def prefetch_latest_release_metadata(client: "httpx.Client", github_token: str | None = None, debug: bool = False) -> Future:
+    """Start the release lookup in the background so it overlaps interactive setup.
+
+    The returned future resolves to the same payload as fetch_latest_release_metadata
+    and re-raises its errors from ``result()``. Callers that exit early can simply
+    drop it.
+    """
+    future: Future = Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fetch_latest_release_metadata(client, github_token, debug))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    # A daemon thread rather than an executor: if init exits early (bad --model,
+    # Esc at a prompt) the abandoned lookup must not hold up interpreter exit,
+    # and concurrent.futures joins its workers at exit even after shutdown(wait=False)
+    threading.Thread(target=_run, name="specify-release", daemon=True).start()
+    return future
+
+
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, release_future: Future | None = None) -> Tuple[Path | bytes, dict]:
+    """Download the template archive for ai_assistant.
+
+    Returns the archive as bytes when it fits in ARCHIVE_IN_MEMORY_MAX,
+    otherwise the path it was written to inside download_dir.
+    """
+    import httpx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = _get_client()
 
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
 
     try:
-        release_data = fetch_latest_release_metadata(client, github_token, debug)
+        if release_future is not None:
+            release_data = release_future.result()
+        else:
+            release_data = fetch_latest_release_metadata(client, github_token, debug)
     except Exception as e:
         console.print("[red]Error fetching release information[/red]")
         console.print(Panel(str(e), title="Fetch Error", border_style="red"))
@@ -1071,12 +1640,12 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
     # Find the template asset for the specified AI assistant
     assets = release_data.get("assets", [])
     pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
-
-    asset = matching_assets[0] if matching_assets else None
+    # Stop at the first matching archive instead of filtering the whole asset list;
+    # plain substring/suffix checks beat a regex on names this short
+    asset = next(
+        (a for a in assets if (name := a["name"]).endswith(".zip") and pattern in name),
+        None,
+    )
 
     if asset is None:
         console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
@@ -1094,6 +1663,8 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
         console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
 
     zip_path = download_dir / filename
+    in_memory = file_size <= ARCHIVE_IN_MEMORY_MAX
+    chunks: list[bytes] = []
     if verbose:
         console.print("[cyan]Downloading template...[/cyan]")
 
@@ -1109,32 +1680,38 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
                 body_sample = response.text[:400]
                 raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
             total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
+            fd = None if in_memory else os.open(zip_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+            write = chunks.append if fd is None else functools.partial(_write_all, fd)
+            try:
+                if total_size == 0 or not show_progress:
                     for chunk in response.iter_bytes(chunk_size=HTTP_CHUNK_SIZE):
-                        f.write(chunk)
+                        write(chunk)
                 else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=HTTP_CHUNK_SIZE):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                        console=console,
+                    ) as progress:
+                        task = progress.add_task("Downloading...", total=total_size)
+                        downloaded = 0
+                        last_update = 0.0
                         for chunk in response.iter_bytes(chunk_size=HTTP_CHUNK_SIZE):
-                            f.write(chunk)
+                            write(chunk)
+                            downloaded += len(chunk)
+                            now = time.monotonic()
+                            if now - last_update >= PROGRESS_REFRESH_SECONDS:
+                                progress.update(task, completed=downloaded)
+                                last_update = now
+                        progress.update(task, completed=downloaded)
+            finally:
+                if fd is not None:
+                    os.close(fd)
     except (httpx.RequestError, httpx.HTTPStatusError, IOError, OSError) as e:
         console.print("[red]Error downloading template[/red]")
         detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
+        if not in_memory:
+            zip_path.unlink(missing_ok=True)
         console.print(Panel(detail, title="Download Error", border_style="red"))
         raise typer.Exit(1)
     if verbose:
@@ -1145,20 +1722,59 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
         "release": release_data["tag_name"],
         "asset_url": download_url
     }
-    return zip_path, metadata
+    return (b"".join(chunks) if in_memory else zip_path), metadata
+
+
+def _copy_file(src: str, dst: str, st: os.stat_result) -> None:
+    """Copy file contents plus mode and timestamps, keeping the bytes in the kernel where possible."""
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = st.st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            copied = True
+        except OSError:
+            # Unsupported filesystem pair (e.g. EXDEV on older kernels); use the generic path
+            copied = False
+    if not copied:
+        if sys.platform in ("linux", "darwin"):
+            # shutil.copyfile uses sendfile / fcopyfile here
+            shutil.copyfile(src, dst)
+        else:
+            # Elsewhere shutil would loop with a small buffer; use 1 MiB reads instead
+            with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    os.chmod(dst, st.st_mode & 0o7777)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fast_copytree(src: Path | str, dst: Path | str) -> None:
+    """Recursively copy src into dst, merging with existing directories.
+
+    Uses os.scandir so each entry is classified from its directory listing and
+    stat'ed at most once, unlike shutil.copytree + copy2.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+            else:
+                _copy_file(entry.path, target, entry.stat())
 
 
 def copy_local_template(project_path: Path, ai_assistant: str, script_type: str, selected_model: str = None, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None) -> Path:
     """Copy local development templates to create a new project for testing.
     Returns project_path. Uses tracker if provided (with keys: copy, agent-setup, cleanup)
     """
-    # Find the development template directory
-    dev_templates_dir = Path(__file__).parent.parent.parent / "templates"
-    dev_memory_dir = Path(__file__).parent.parent.parent / "memory"
-    dev_scripts_dir = Path(__file__).parent.parent.parent / "scripts"
-
-    if not dev_templates_dir.exists():
-        raise RuntimeError(f"Local templates directory not found: {dev_templates_dir}")
+    if not _DEV_TEMPLATES_DIR.exists():
+        raise RuntimeError(f"Local templates directory not found: {_DEV_TEMPLATES_DIR}")
 
     if tracker:
         tracker.start("copy", "copying local templates")
@@ -1171,24 +1787,24 @@ def copy_local_template(project_path: Path, ai_assistant: str, script_type: str,
         specify_dir = project_path / ".specify"
         specify_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy memory
-        if dev_memory_dir.exists():
-            shutil.copytree(dev_memory_dir, specify_dir / "memory", dirs_exist_ok=True)
-
-        # Copy scripts
-        if dev_scripts_dir.exists():
-            shutil.copytree(dev_scripts_dir, specify_dir / "scripts", dirs_exist_ok=True)
-
-        # Copy templates to .specify/templates
-        shutil.copytree(dev_templates_dir, specify_dir / "templates", dirs_exist_ok=True)
-
-        # Copy VS Code workspace settings to project root
-        vscode_src = dev_templates_dir / ".vscode"
+        # Templates go to .specify/templates; memory, scripts and VS Code settings are optional
+        copy_jobs = [(_DEV_TEMPLATES_DIR, specify_dir / "templates")]
+        if _DEV_MEMORY_DIR.exists():
+            copy_jobs.append((_DEV_MEMORY_DIR, specify_dir / "memory"))
+        if _DEV_SCRIPTS_DIR.exists():
+            copy_jobs.append((_DEV_SCRIPTS_DIR, specify_dir / "scripts"))
+        vscode_src = _DEV_TEMPLATES_DIR / ".vscode"
         if vscode_src.exists():
-            shutil.copytree(vscode_src, project_path / ".vscode", dirs_exist_ok=True)
+            copy_jobs.append((vscode_src, project_path / ".vscode"))
+
+        # The subtrees have disjoint destinations, so copy them concurrently to overlap I/O
+        with ThreadPoolExecutor(max_workers=len(copy_jobs)) as executor:
+            futures = [executor.submit(_fast_copytree, src, dst) for src, dst in copy_jobs]
+            for future in futures:
+                future.result()
 
         # Copy GitHub Copilot guidance (excluding prompts, which are regenerated)
-        github_src = dev_templates_dir / ".github"
+        github_src = _DEV_TEMPLATES_DIR / ".github"
         github_dest = project_path / ".github"
         github_dest.mkdir(parents=True, exist_ok=True)
 
@@ -1198,10 +1814,9 @@ def copy_local_template(project_path: Path, ai_assistant: str, script_type: str,
                     continue
                 dest_path = github_dest / item.name
                 if item.is_dir():
-                    shutil.copytree(item, dest_path, dirs_exist_ok=True)
+                    _fast_copytree(item, dest_path)
                 else:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dest_path)
+                    _copy_file(str(item), str(dest_path), item.stat())
 
         # Ensure prompts directory exists; contents will be generated below
         (github_dest / "prompts").mkdir(parents=True, exist_ok=True)
@@ -1232,10 +1847,8 @@ def setup_agent_commands(project_path: Path, ai_assistant: str, script_type: str
     output_dir = project_path / config["dir"]
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    script_folder_map = {"ps": "powershell", "sh": "bash"}
-    script_extension_map = {"ps": "ps1", "sh": "sh"}
-    script_folder = script_folder_map.get(script_type, script_type)
-    script_extension = script_extension_map.get(script_type, script_type)
+    script_folder = _SCRIPT_FOLDERS.get(script_type, script_type)
+    script_extension = _SCRIPT_EXTENSIONS.get(script_type, script_type)
 
     # Persist configuration (model + script metadata) for status reporting
     if ai_assistant == "copilot":
@@ -1244,25 +1857,36 @@ def setup_agent_commands(project_path: Path, ai_assistant: str, script_type: str
 
         config_file = config_dir / "models.json"
         existing: dict = {}
-        if config_file.exists():
-            try:
-                existing = json.loads(config_file.read_text())
-            except (json.JSONDecodeError, IOError, OSError):
-                # Config file is corrupted or unreadable, start fresh
-                existing = {}
+        existing_bytes = b""
+        try:
+            existing_bytes = config_file.read_bytes()
+            existing = _loads_json(existing_bytes)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError, OSError):
+            # Config file is corrupted or unreadable, start fresh
+            existing = {}
 
         config_payload = existing.copy()
 
         github_meta = config_payload.get("github_models", {})
         catalog_meta = _load_models_cache_metadata() or {}
+        now_iso = datetime.now(timezone.utc).isoformat()  # Shared by both last_updated stamps
         if selected_model:
-            github_meta.update(
-                {
-                    "selected_model": selected_model,
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
-                    "catalog_source": catalog_meta.get("source") or github_meta.get("catalog_source", "user-selection"),
-                }
-            )
+            catalog_source = catalog_meta.get("source") or github_meta.get("catalog_source", "user-selection")
+            # last_updated only moves when the selection itself changes
+            if (
+                "last_updated" not in github_meta
+                or github_meta.get("selected_model") != selected_model
+                or github_meta.get("catalog_source") != catalog_source
+            ):
+                github_meta.update(
+                    {
+                        "selected_model": selected_model,
+                        "last_updated": now_iso,
+                        "catalog_source": catalog_source,
+                    }
+                )
         elif catalog_meta.get("source") and "catalog_source" not in github_meta:
             github_meta["catalog_source"] = catalog_meta.get("source")
 
@@ -1276,42 +1900,153 @@ def setup_agent_commands(project_path: Path, ai_assistant: str, script_type: str
                 pass
         config_payload["github_models"] = github_meta
 
-        config_payload["scripts"] = {
+        scripts_meta = {
             "preferred": script_type,
             "folder": script_folder,
             "extension": script_extension,
-            "last_updated": datetime.now(timezone.utc).isoformat(),
         }
+        previous_scripts = config_payload.get("scripts") or {}
+        if "last_updated" in previous_scripts and all(previous_scripts.get(k) == v for k, v in scripts_meta.items()):
+            scripts_meta["last_updated"] = previous_scripts["last_updated"]
+        else:
+            scripts_meta["last_updated"] = now_iso
+        config_payload["scripts"] = scripts_meta
+
+        # Re-running init with the same settings leaves the file untouched
+        config_bytes = _json_bytes(config_payload, indent=True)
+        if config_bytes != existing_bytes:
+            config_file.write_bytes(config_bytes)
+
+    # The output format is the same for every template
+    arg_placeholder = config["arg_placeholder"]
+    is_toml = config["format"] == "toml"
+    output_suffix = {"toml": ".toml", "prompt.md": ".prompt.md"}.get(config["format"], ".md")
+    script_prefix = f".specify/scripts/{script_folder}/"
+
+    def render_command(template_file: Path) -> None:
+        command_name = template_file.stem
+        content = template_file.read_text()
+
+        # Replace placeholders in a single pass over the template
+        substitutions = {
+            "$ARGUMENTS": arg_placeholder,
+            "{SCRIPT}": f"{script_prefix}{command_name}.{script_extension}",
+        }
+        content = _PLACEHOLDER_RE.sub(lambda match: substitutions[match.group(0)], content)
 
-        config_file.write_text(json.dumps(config_payload, indent=2))
+        if is_toml:
+            # Wrap in TOML format
+            description = content.split('\n', 1)[0].strip('# ').strip()  # Extract description from first line
+            prompt_content = content.replace(f'# {description}', '', 1).strip()
+            content = f'description = "{description}"\n\nprompt = """\n{prompt_content}\n"""'
 
-    # Process each command template
-    if templates_dir.exists():
-        for template_file in templates_dir.glob("*.md"):
-            command_name = template_file.stem
-            content = template_file.read_text()
+        (output_dir / f"{command_name}{output_suffix}").write_text(content)
 
-            # Replace placeholders
-            content = content.replace("$ARGUMENTS", config["arg_placeholder"])
-            content = content.replace(
-                "{SCRIPT}", f".specify/scripts/{script_folder}/{template_file.stem}.{script_extension}"
-            )
+    # Process each command template; reads, substitutions and writes overlap across files
+    try:
+        with os.scandir(templates_dir) as it:
+            template_files = [Path(entry.path) for entry in it if entry.name.endswith(".md") and entry.is_file()]
+    except FileNotFoundError:
+        template_files = []
+    if template_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(template_files))) as executor:
+            list(executor.map(render_command, template_files))
 
-            if config["format"] == "toml":
-                # Wrap in TOML format
-                description = content.split('\n', 1)[0].strip('# ').strip()  # Extract description from first line
-                prompt_content = content.replace(f'# {description}', '', 1).strip()
-                content = f'description = "{description}"\n\nprompt = """\n{prompt_content}\n"""'
-                output_file = output_dir / f"{command_name}.toml"
-            elif config["format"] == "prompt.md":
-                output_file = output_dir / f"{command_name}.prompt.md"
-            else:
-                output_file = output_dir / f"{command_name}.md"
 
-            output_file.write_text(content)
+def _open_zip(archive: Path | bytes) -> zipfile.ZipFile:
+    """Open a template archive held either on disk or in memory."""
+    return zipfile.ZipFile(io.BytesIO(archive) if isinstance(archive, bytes) else archive)
+
 
+def _extract_zip(archive: Path | bytes, dest: Path, members: list[zipfile.ZipInfo], strip_prefix: str = "") -> None:
+    """Extract members of archive into dest, writing files on a thread pool.
+
+    Members are streamed straight to their final location; strip_prefix (e.g.
+    the single root folder of a GitHub archive) is removed from each name on
+    the way. Directories are created up front so workers never race on
+    makedirs, and each worker reads through its own ZipFile handle.
+    """
+    directories: set[Path] = set()
+    jobs: list[tuple[zipfile.ZipInfo, Path]] = []
+    for member in members:
+        name = member.filename
+        if strip_prefix:
+            if not name.startswith(strip_prefix):
+                continue
+            name = name[len(strip_prefix):]
+        parts = [part for part in name.replace("\\", "/").split("/") if part]
+        if not parts:
+            continue
+        # ":" is only special on Windows (drive letters, alternate streams); POSIX names may use it
+        if name.startswith(("/", "\\")) or (_IS_WINDOWS and ":" in name) or ".." in parts:
+            raise ValueError(f"Unsafe path in template archive: {member.filename}")
+        target = dest.joinpath(*parts)
+        if member.is_dir():
+            directories.add(target)
+        else:
+            directories.add(target.parent)
+            jobs.append((member, target))
+
+    # makedirs creates parents itself, so only the deepest directories need a call
+    parents = {parent for directory in directories for parent in directory.parents}
+    for directory in directories - parents:
+        os.makedirs(directory, exist_ok=True)
+
+    local = threading.local()
+    handles: list[zipfile.ZipFile] = []
+
+    def extract(job: tuple[zipfile.ZipInfo, Path]) -> None:
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = _open_zip(archive)
+            handles.append(zf)
+        member, target = job
+        with zf.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
+    try:
+        if len(jobs) < 2:
+            for job in jobs:
+                extract(job)
+        else:
+            # Largest members first so one big file doesn't finish last on an idle pool
+            jobs.sort(key=lambda job: job[0].file_size, reverse=True)
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(jobs))) as executor:
+                list(executor.map(extract, jobs))
+    finally:
+        for zf in handles:
+            zf.close()
+
+
+def _archive_layout(infos: list[zipfile.ZipInfo]) -> tuple[str, dict[str, bool]]:
+    """Describe an archive's top level in a single pass over its members.
+
+    Returns (root_prefix, top_level). root_prefix is "root/" when every entry
+    lives under one top-level folder (GitHub-style archives), else "".
+    top_level maps each top-level name, after removing root_prefix, to
+    whether it is a directory.
+    """
+    top: dict[str, bool] = {}
+    nested: dict[str, bool] | None = {}  # children of the single root; None once disproved
+    root = None
+    for info in infos:
+        head, sep, rest = info.filename.partition("/")
+        top[head] = top.get(head, False) or bool(sep)
+        if nested is None:
+            continue
+        if root is None:
+            root = head
+        if head != root or not sep:
+            nested = None
+        elif rest:
+            child, child_sep, _ = rest.partition("/")
+            nested[child] = nested.get(child, False) or bool(child_sep)
+    if nested is not None and root is not None:
+        return root + "/", nested
+    return "", top
+
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, release_future: Future | None = None) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
     """
@@ -1321,7 +2056,7 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     if tracker:
         tracker.start("fetch", "contacting GitHub API")
     try:
-        zip_path, meta = download_template_from_github(
+        archive, meta = download_template_from_github(
             ai_assistant,
             current_dir,
             script_type=script_type,
@@ -1329,7 +2064,8 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             show_progress=(tracker is None),
             client=client,
             debug=debug,
-            github_token=github_token
+            github_token=github_token,
+            release_future=release_future,
         )
         if tracker:
             tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
@@ -1349,96 +2085,61 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     elif verbose:
         console.print("Extracting template...")
 
+    # New projects are extracted into a hidden sibling and renamed into place
+    # in one step, so a failed extraction never leaves a half-written project
+    extract_dir = project_path if is_current_dir else project_path.parent / f".{project_path.name}.specify-tmp"
     try:
-        # Create project directory only if not using current directory
         if not is_current_dir:
-            project_path.mkdir(parents=True)
-
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # List all files in the ZIP for debugging
-            zip_contents = zip_ref.namelist()
+            if project_path.exists():
+                raise FileExistsError(f"Directory already exists: {project_path}")
+            if extract_dir.exists():
+                _remove_tree(extract_dir)
+            extract_dir.mkdir(parents=True)
+
+        with _open_zip(archive) as zip_ref:
+            # Read the member list once; root detection and extraction both use it
+            infos = zip_ref.infolist()
             if tracker:
                 tracker.start("zip-list")
-                tracker.complete("zip-list", f"{len(zip_contents)} entries")
+                tracker.complete("zip-list", f"{len(infos)} entries")
             elif verbose:
-                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
-
-            # For current directory, extract to a temp location first
-            if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-
-                    # Check what was extracted
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"temp {len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-
-                    # Handle GitHub-style ZIP with a single root directory
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-                        if tracker:
-                            tracker.add("flatten", "Flatten nested directory")
-                            tracker.complete("flatten")
-                        elif verbose:
-                            console.print("[cyan]Found nested directory structure[/cyan]")
-
-                    # Copy contents to current directory
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            if dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                # Recursively copy directory contents
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print("[cyan]Template files merged into current directory[/cyan]")
-            else:
-                # Extract directly to project directory (original behavior)
-                zip_ref.extractall(project_path)
+                console.print(f"[cyan]ZIP contains {len(infos)} items[/cyan]")
+
+            # Detect a GitHub-style single root directory from the listing so
+            # entries are written straight to their final location without it
+            root_prefix, top_level = _archive_layout(infos)
 
-                # Check what was extracted
-                extracted_items = list(project_path.iterdir())
+            if tracker:
+                tracker.start("extracted-summary")
+                tracker.complete("extracted-summary", f"{len(top_level)} top-level items")
+            elif verbose:
+                lines = [f"[cyan]Extracting {len(top_level)} items to {project_path}:[/cyan]"]
+                lines.extend(f"  - {name} ({'dir' if is_dir else 'file'})" for name, is_dir in top_level.items())
+                console.print("\n".join(lines))
+
+            if root_prefix:
                 if tracker:
-                    tracker.start("extracted-summary")
-                    tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
+                    tracker.add("flatten", "Flatten nested directory")
+                    tracker.complete("flatten")
                 elif verbose:
-                    console.print(f"[cyan]Extracted {len(extracted_items)} items to {project_path}:[/cyan]")
-                    for item in extracted_items:
-                        console.print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
-
-                # Handle GitHub-style ZIP with a single root directory
-                if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                    # Move contents up one level
-                    nested_dir = extracted_items[0]
-                    temp_move_dir = project_path.parent / f"{project_path.name}_temp"
-                    # Move the nested directory contents to temp location
-                    shutil.move(str(nested_dir), str(temp_move_dir))
-                    # Remove the now-empty project directory
-                    project_path.rmdir()
-                    # Rename temp directory to project directory
-                    shutil.move(str(temp_move_dir), str(project_path))
-                    if tracker:
-                        tracker.add("flatten", "Flatten nested directory")
-                        tracker.complete("flatten")
-                    elif verbose:
-                        console.print("[cyan]Flattened nested directory structure[/cyan]")
+                    console.print("[cyan]Flattening nested directory structure[/cyan]")
+
+            if is_current_dir and verbose and not tracker:
+                # One directory listing instead of an exists() probe per item
+                existing = set(os.listdir(project_path))
+                for name, is_dir in top_level.items():
+                    if name in existing:
+                        if is_dir:
+                            console.print(f"[yellow]Merging directory:[/yellow] {name}")
+                        else:
+                            console.print(f"[yellow]Overwriting file:[/yellow] {name}")
+
+            _extract_zip(archive, extract_dir, infos, strip_prefix=root_prefix)
+            if is_current_dir and verbose and not tracker:
+                console.print("[cyan]Template files merged into current directory[/cyan]")
+
+        if not is_current_dir:
+            os.replace(extract_dir, project_path)
 
     except Exception as e:
         if tracker:
@@ -1448,9 +2149,10 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                 console.print(f"[red]Error extracting template:[/red] {e}")
                 if debug:
                     console.print(Panel(str(e), title="Extraction Error", border_style="red"))
-        # Clean up project directory if created and not current directory
-        if not is_current_dir and project_path.exists():
-            shutil.rmtree(project_path)
+        # Clean up the staging directory; an existing project_path is never touched,
+        # and neither is a symlink squatting on the staging name (it failed above)
+        if not is_current_dir and extract_dir.exists() and not extract_dir.is_symlink():
+            _remove_tree(extract_dir)
         raise typer.Exit(1)
     else:
         if tracker:
@@ -1458,54 +2160,60 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
     finally:
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
-        # Clean up downloaded ZIP file
-        if zip_path.exists():
-            zip_path.unlink()
+        # Clean up downloaded ZIP file; in-memory archives leave nothing behind
+        if isinstance(archive, bytes):
+            if tracker:
+                tracker.complete("cleanup", "in memory")
+        else:
+            archive.unlink(missing_ok=True)
             if tracker:
                 tracker.complete("cleanup")
             elif verbose:
-                console.print(f"Cleaned up: {zip_path.name}")
+                console.print(f"Cleaned up: {archive.name}")
 
     return project_path
 
 
+def _iter_shell_scripts(root: Path | str):
+    """Yield os.DirEntry objects for regular *.sh files under root, not following symlinks."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_shell_scripts(entry.path)
+            elif entry.name.endswith(".sh") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
 def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
     """Ensure POSIX .sh scripts under .specify/scripts (recursively) have execute bits (no-op on Windows)."""
-    if os.name == "nt":
+    if _IS_WINDOWS:
         return  # Windows: skip silently
     scripts_root = project_path / ".specify" / "scripts"
     if not scripts_root.is_dir():
         return
-    failures: list[str] = []
-    updated = 0
-    for script in scripts_root.rglob("*.sh"):
+
+    def make_executable(entry: os.DirEntry) -> tuple[bool, str | None]:
         try:
-            if script.is_symlink() or not script.is_file():
-                continue
-            try:
-                with script.open("rb") as f:
-                    if f.read(2) != b"#!":
-                        continue
-            except (IOError, OSError):
-                # File read errors should skip the file
-                continue
-            st = script.stat()
-            mode = st.st_mode
+            # Every .sh under .specify/scripts ships from our own templates, so
+            # no shebang probe is needed before setting the execute bits
+            mode = entry.stat(follow_symlinks=False).st_mode
             if mode & 0o111:
-                continue
-            new_mode = mode
-            if mode & 0o400:
-                new_mode |= 0o100
-            if mode & 0o040:
-                new_mode |= 0o010
-            if mode & 0o004:
-                new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
-            updated += 1
+                return False, None
+            # Mirror each read bit into the matching execute bit; owner always gets +x
+            os.chmod(entry.path, mode | ((mode & 0o444) >> 2) | 0o100)
+            return True, None
         except Exception as e:
-            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+            return False, f"{os.path.relpath(entry.path, scripts_root)}: {e}"
+
+    scripts = list(_iter_shell_scripts(scripts_root))
+    if len(scripts) > 1:
+        # stat/chmod release the GIL, so their latency overlaps on slow (e.g. network) filesystems
+        with ThreadPoolExecutor(max_workers=min(8, len(scripts))) as executor:
+            results = list(executor.map(make_executable, scripts))
+    else:
+        results = [make_executable(entry) for entry in scripts]
+    updated = sum(changed for changed, _ in results)
+    failures = [error for _, error in results if error]
     if tracker:
         detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
         tracker.add("chmod", "Set script permissions recursively")
@@ -1522,23 +2230,67 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
 def _merge_directory(source: Path, destination: Path) -> list[str]:
     """Merge source directory into destination, returning list of new relative paths copied."""
     copied: list[str] = []
-    if not source.exists() or not source.is_dir():
+    if not source.is_dir():
         return copied
 
-    destination.mkdir(parents=True, exist_ok=True)
+    # Walk iteratively with each relative prefix built once, rather than
+    # recursing and re-prefixing every child's results on the way back up
+    pending = [(str(source), str(destination), "")]
+    while pending:
+        src_dir, dst_dir, prefix = pending.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        # One listing of the destination replaces an exists() probe per file
+        existing = set(os.listdir(dst_dir))
+
+        # scandir classifies entries from the directory listing, so each source
+        # file is stat'ed once and its bytes are copied by _copy_file in-kernel
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target, f"{prefix}{entry.name}/"))
+                elif entry.name not in existing:
+                    _copy_file(entry.path, target, entry.stat())
+                    copied.append(prefix + entry.name)
+    return copied
+
+
+def _remove_tree(path: Path | str) -> None:
+    """Delete a directory tree, unlinking its files on a thread pool.
 
-    for item in source.iterdir():
-        target = destination / item.name
-        if item.is_dir():
-            child_results = _merge_directory(item, target)
-            copied.extend([f"{item.name}/{child}" for child in child_results])
+    Symlinks inside the tree are removed, never followed. A symlinked root
+    goes straight to shutil.rmtree, which refuses it without touching the
+    link's target. Any other failure also falls back to shutil.rmtree, which
+    reports the error for whatever is left.
+    """
+    if os.path.islink(path):
+        shutil.rmtree(path)  # Raises OSError: "Cannot call rmtree on a symbolic link"
+        return
+    files: list[str] = []
+    dirs: list[str] = []
+    pending = [os.fspath(path)]
+    try:
+        while pending:
+            current = pending.pop()
+            dirs.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        if len(files) > 1:
+            # unlink releases the GIL, so overlapping calls hide per-file metadata latency
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+                list(executor.map(os.unlink, files))
         else:
-            if target.exists():
-                continue
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target)
-            copied.append(item.name)
-    return copied
+            for file in files:
+                os.unlink(file)
+        # Children were discovered after their parents, so reverse order empties each directory first
+        for directory in reversed(dirs):
+            os.rmdir(directory)
+    except OSError:
+        shutil.rmtree(path)
 
 
 def sync_workspace_config(project_path: Path, workspace_root: Path) -> tuple[bool, str]:
@@ -1555,15 +2307,14 @@ def sync_workspace_config(project_path: Path, workspace_root: Path) -> tuple[boo
     if not is_git_repo(workspace_root):
         return False, "workspace root not a git repo"
 
-    synced_dirs: list[str] = []
-    for dirname in WORKSPACE_DOT_DIRS:
-        source = project_path / dirname
-        if not source.exists():
-            continue
-        destination = workspace_root / dirname
-        copied = _merge_directory(source, destination)
-        if copied:
-            synced_dirs.append(dirname)
+    # Each dot-directory merges into its own destination, so overlap their I/O;
+    # results are read back in WORKSPACE_DOT_DIRS order to keep the detail stable
+    with ThreadPoolExecutor(max_workers=len(WORKSPACE_DOT_DIRS)) as executor:
+        futures = [
+            (dirname, executor.submit(_merge_directory, project_path / dirname, workspace_root / dirname))
+            for dirname in WORKSPACE_DOT_DIRS
+        ]
+        synced_dirs = [dirname for dirname, future in futures if future.result()]
 
     if not synced_dirs:
         return False, "no workspace directories to sync"
@@ -1574,7 +2325,12 @@ def sync_workspace_config(project_path: Path, workspace_root: Path) -> tuple[boo
 
 def resolve_workspace_root(start: Path) -> Path:
     """Return git workspace root if inside a repo, otherwise the starting path."""
-    if is_git_repo(start):
+    if start.is_dir():
+        top = _find_git_worktree(str(start.resolve()))
+        if top is not None:
+            return top
+    # Only GIT_DIR/GIT_WORK_TREE can point git at a work tree the walk missed
+    if ("GIT_DIR" in os.environ or "GIT_WORK_TREE" in os.environ) and is_git_repo(start):
         try:
             result = subprocess.run(  # nosec B603,B607 - git is required, input is controlled
                 ["git", "rev-parse", "--show-toplevel"],
@@ -1590,6 +2346,28 @@ def resolve_workspace_root(start: Path) -> Path:
             pass
     return start
 
+# Static parts of the closing panels printed by init
+_NEXT_STEPS_TAIL = "\n".join((
+    "2. Start using slash commands with GitHub Models:",
+    "   2.1 [cyan]/constitution[/] - Establish project principles",
+    "   2.2 [cyan]/specify[/] - Create baseline specification",
+    "   2.3 [cyan]/plan[/] - Create implementation plan",
+    "   2.4 [cyan]/tasks[/] - Generate actionable tasks",
+    "   2.5 [cyan]/implement[/] - Execute implementation",
+))
+_ENHANCEMENTS_PANEL = Panel(
+    "\n".join((
+        "Optional commands that you can use for your specs [bright_black](improve quality & confidence)[/bright_black]",
+        "",
+        "○ [cyan]/clarify[/] [bright_black](optional)[/bright_black] - Ask structured questions to de-risk ambiguous areas before planning (run before [cyan]/plan[/] if used)",
+        "○ [cyan]/analyze[/] [bright_black](optional)[/bright_black] - Cross-artifact consistency & alignment report (after [cyan]/tasks[/], before [cyan]/implement[/])",
+    )),
+    title="Enhancement Commands",
+    border_style="cyan",
+    padding=(1, 2),
+)
+
+
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
@@ -1604,6 +2382,7 @@ def init(
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
     local: bool = typer.Option(False, "--local", help="Use local templates from development environment (for testing)"),
+    refresh_catalog: bool = typer.Option(False, "--refresh-catalog", help="Skip the cached GitHub Models catalog and fetch it from the API"),
 ):
     """
     Initialize a new Specify project from the latest template.
@@ -1647,10 +2426,11 @@ def init(
         project_name = Path.cwd().name
         project_path = Path.cwd()
 
-        # Check if current directory has any files
-        existing_items = list(project_path.iterdir())
-        if existing_items:
-            console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)")
+        # Check if current directory has any files; only the count is needed, not Path objects
+        with os.scandir(project_path) as it:
+            existing_count = sum(1 for _ in it)
+        if existing_count:
+            console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({existing_count} items)")
             console.print("[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]")
             if force:
                 console.print("[cyan]--force supplied: skipping confirmation and proceeding with merge[/cyan]")
@@ -1699,16 +2479,28 @@ def init(
         if not should_init_git:
             console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
 
+    # Reject bad --ai/--script values before any network work starts
+    if ai_assistant and ai_assistant not in AI_CHOICES:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {_AI_CHOICES_STR}")
+        raise typer.Exit(1)
+    if script_type and script_type not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {_SCRIPT_CHOICES_STR}")
+        raise typer.Exit(1)
+
+    # Resolve the HTTP client up front so the release lookup can run while models are selected
+    if skip_tls:
+        local_client = _new_client(verify=False)
+    else:
+        local_client = _get_client()
+    release_future = None if local else prefetch_latest_release_metadata(local_client, github_token, debug)
+
     # AI assistant selection
     if ai_assistant:
-        if ai_assistant not in AI_CHOICES:
-            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AI_CHOICES.keys())}")
-            raise typer.Exit(1)
         selected_ai = ai_assistant
     else:
         # Auto-select when only one assistant is available
         if len(AI_CHOICES) == 1:
-            selected_ai = next(iter(AI_CHOICES.keys()))
+            selected_ai = _FIRST_AI_CHOICE
         else:
             # Use arrow-key selection interface
             selected_ai = select_with_arrows(
@@ -1717,25 +2509,32 @@ def init(
                 "copilot"
             )
 
+    # Both selection prompts need a terminal on each end; check once
+    is_interactive = sys.stdin.isatty() and sys.stdout.isatty()
+
     # Model selection (if using GitHub Models)
     selected_model = None
     if selected_ai == "copilot":
         if model:
             # Validate the provided model exists
             console.print(f"[cyan]Validating model '{model}'...[/cyan]")
-            available_models = fetch_github_models(github_token)
+            available_models = fetch_github_models(github_token, use_cache=not refresh_catalog)
             if model not in available_models:
                 console.print(f"[red]Error:[/red] Model '{model}' not found in GitHub Models catalog.")
                 console.print("\n[yellow]Did you mean one of these?[/yellow]")
-                # Show similar model names
-                similar = [m for m in available_models.keys() if model.lower() in m.lower() or m.lower() in model.lower()]
+                # Show similar model names; only a bounded prefix is ever shown, so select rather than sort
+                model_lc = model.lower()
+                similar = heapq.nsmallest(10, (m for m in available_models if model_lc in (m_lc := m.lower()) or m_lc in model_lc))
+                if not similar:
+                    # No substring hit: fall back to edit similarity to catch typos (best match first)
+                    similar = difflib.get_close_matches(model, available_models, n=10, cutoff=0.6)
                 if similar:
-                    for m in sorted(similar)[:10]:
+                    for m in similar:
                         console.print(f"  • {m}")
                 else:
                     # Show first 20 models as examples
                     console.print("[yellow]Available models (showing first 20):[/yellow]")
-                    for m in sorted(available_models.keys())[:20]:
+                    for m in heapq.nsmallest(20, available_models):
                         console.print(f"  • {m}")
                 console.print(f"\n[dim]Use 'specify list-models' to see all {len(available_models)} available models[/dim]")
                 raise typer.Exit(1)
@@ -1744,10 +2543,10 @@ def init(
         else:
             # Fetch and select from available models (interactive or default)
             console.print("[cyan]Fetching available GitHub Models...[/cyan]")
-            available_models = fetch_github_models(github_token)
+            available_models = fetch_github_models(github_token, use_cache=not refresh_catalog)
             if available_models:
                 # Check if we're in an interactive terminal
-                if sys.stdin.isatty() and sys.stdout.isatty():
+                if is_interactive:
                     # Show interactive model selection
                     selected_model = select_with_arrows(
                         available_models,
@@ -1770,15 +2569,12 @@ def init(
 
     # Determine script type (explicit, interactive, or OS default)
     if script_type:
-        if script_type not in SCRIPT_TYPE_CHOICES:
-            console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
-            raise typer.Exit(1)
         selected_script = script_type
     else:
         # Auto-detect default based on OS
-        default_script = "ps" if os.name == "nt" else "sh"
+        default_script = _DEFAULT_SCRIPT
         # Provide interactive selection if in a TTY, otherwise use default
-        if sys.stdin.isatty() and sys.stdout.isatty():
+        if is_interactive:
             selected_script = select_with_arrows(
                 SCRIPT_TYPE_CHOICES,
                 "Choose script type (or press Enter for default)",
@@ -1819,57 +2615,54 @@ def init(
     ]:
         tracker.add(key, label)
 
+    from rich.live import Live
+
     # Use transient so live tree is replaced by the final static render (avoids duplicate output)
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    # Live polls the tracker at refresh_per_second, so bursts of step updates
+    # cost at most one tree render per frame instead of one per update
+    with Live(tracker, console=console, refresh_per_second=8, transient=True):
         try:
-            # Create a httpx client with verify based on skip_tls
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-
-            # Use context manager to ensure proper resource cleanup
-            with httpx.Client(verify=local_ssl_context) as local_client:
-                if local:
-                    copy_local_template(project_path, selected_ai, selected_script, selected_model, here, verbose=False, tracker=tracker)
-                else:
-                    download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
+            if local:
+                copy_local_template(project_path, selected_ai, selected_script, selected_model, here, verbose=False, tracker=tracker)
+            else:
+                download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, release_future=release_future)
 
-                tracker.start("workspace")
-                try:
-                    synced, detail = sync_workspace_config(project_path, current_dir)
-                except (IOError, OSError, RuntimeError) as sync_error:
-                    tracker.error("workspace", str(sync_error))
+            tracker.start("workspace")
+            try:
+                synced, detail = sync_workspace_config(project_path, current_dir)
+            except (IOError, OSError, RuntimeError) as sync_error:
+                tracker.error("workspace", str(sync_error))
+            else:
+                if synced:
+                    tracker.complete("workspace", detail)
                 else:
-                    if synced:
-                        tracker.complete("workspace", detail)
+                    tracker.skip("workspace", detail)
+
+            # Ensure scripts are executable (POSIX)
+            ensure_executable_scripts(project_path, tracker=tracker)
+
+            # Git step
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    if init_git_repo(project_path, quiet=True):
+                        tracker.complete("git", "initialized")
                     else:
-                        tracker.skip("workspace", detail)
-
-                # Ensure scripts are executable (POSIX)
-                ensure_executable_scripts(project_path, tracker=tracker)
-
-                # Git step
-                if not no_git:
-                    tracker.start("git")
-                    if is_git_repo(project_path):
-                        tracker.complete("git", "existing repo detected")
-                    elif should_init_git:
-                        if init_git_repo(project_path, quiet=True):
-                            tracker.complete("git", "initialized")
-                        else:
-                            tracker.error("git", "init failed")
-                    else:
-                        tracker.skip("git", "git not available")
+                        tracker.error("git", "init failed")
                 else:
-                    tracker.skip("git", "--no-git flag")
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
 
-                tracker.complete("final", "project ready")
+            tracker.complete("final", "project ready")
         except Exception as e:
             tracker.error("final", str(e))
             console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
             if debug:
                 _env_pairs = [
-                    ("Python", sys.version.split()[0]),
+                    ("Python", _PY_VERSION),
                     ("Platform", sys.platform),
                     ("CWD", str(Path.cwd())),
                 ]
@@ -1877,7 +2670,7 @@ def init(
                 env_lines = [f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]" for k, v in _env_pairs]
                 console.print(Panel("\n".join(env_lines), title="Debug Environment", border_style="magenta"))
             if not here and project_path.exists():
-                shutil.rmtree(project_path)
+                _remove_tree(project_path)
             raise typer.Exit(1)
         finally:
             # Force final render
@@ -1887,13 +2680,12 @@ def init(
     console.print(tracker.render())
     console.print("\n[bold green]Project ready.[/bold green]")
 
-    # Agent folder security notice
-    agent_folder_map = {
-        "copilot": ".github/"
-    }
+    # The closing panels are rendered and written in a single print
+    closing: list = []
 
-    if selected_ai in agent_folder_map:
-        agent_folder = agent_folder_map[selected_ai]
+    # Agent folder security notice
+    agent_folder = AGENT_FOLDER_MAP.get(selected_ai)
+    if agent_folder is not None:
         security_notice = Panel(
             f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
             f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
@@ -1901,39 +2693,17 @@ def init(
             border_style="yellow",
             padding=(1, 2)
         )
-        console.print()
-        console.print(security_notice)
+        closing.extend(("", security_notice))
 
-    # Boxed "Next steps" section
-    steps_lines = []
+    # Boxed "Next steps" section; only the first line depends on the invocation
     if not here:
-        steps_lines.append(f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]")
-        step_num = 2
+        first_step = f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]"
     else:
-        steps_lines.append("1. You're already in the project directory!")
-        step_num = 2
-
-    steps_lines.append(f"{step_num}. Start using slash commands with GitHub Models:")
+        first_step = "1. You're already in the project directory!"
 
-    steps_lines.append("   2.1 [cyan]/constitution[/] - Establish project principles")
-    steps_lines.append("   2.2 [cyan]/specify[/] - Create baseline specification")
-    steps_lines.append("   2.3 [cyan]/plan[/] - Create implementation plan")
-    steps_lines.append("   2.4 [cyan]/tasks[/] - Generate actionable tasks")
-    steps_lines.append("   2.5 [cyan]/implement[/] - Execute implementation")
-
-    steps_panel = Panel("\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1,2))
-    console.print()
-    console.print(steps_panel)
-
-    enhancement_lines = [
-        "Optional commands that you can use for your specs [bright_black](improve quality & confidence)[/bright_black]",
-        "",
-        "○ [cyan]/clarify[/] [bright_black](optional)[/bright_black] - Ask structured questions to de-risk ambiguous areas before planning (run before [cyan]/plan[/] if used)",
-        "○ [cyan]/analyze[/] [bright_black](optional)[/bright_black] - Cross-artifact consistency & alignment report (after [cyan]/tasks[/], before [cyan]/implement[/])"
-    ]
-    enhancements_panel = Panel("\n".join(enhancement_lines), title="Enhancement Commands", border_style="cyan", padding=(1,2))
-    console.print()
-    console.print(enhancements_panel)
+    steps_panel = Panel(f"{first_step}\n{_NEXT_STEPS_TAIL}", title="Next Steps", border_style="cyan", padding=(1,2))
+    closing.extend(("", steps_panel, "", _ENHANCEMENTS_PANEL))
+    console.print(Group(*closing))
 
 
 
@@ -1953,6 +2723,7 @@ def check():
     # GitHub Models is IDE-based (no CLI tool required)
     tracker.add("copilot", f"{AI_CHOICES['copilot']} (IDE-based, optional)")
 
+    # Memoized PATH lookups take microseconds; a thread pool would cost more than it saves
     git_ok = check_tool_for_tracker("git", tracker)
     code_ok = check_tool_for_tracker("code", tracker)
     code_insiders_ok = check_tool_for_tracker("code-insiders", tracker)
@@ -1982,12 +2753,13 @@ def list_models(
 
     # Handle cache clearing
     if clear_cache:
-        cache_file = _models_cache_path()
-        if cache_file.exists():
-            cache_file.unlink()
-            console.print("[green]✓ Models cache cleared[/green]")
-        else:
+        try:
+            # unlink reports a missing file itself; no separate exists() probe
+            _models_cache_path().unlink()
+        except FileNotFoundError:
             console.print("[yellow]No cache file found[/yellow]")
+        else:
+            console.print("[green]✓ Models cache cleared[/green]")
         return
 
     console.print("[bold]Fetching available GitHub Models...[/bold]\n")
@@ -2007,7 +2779,7 @@ def list_models(
     table.add_column("Model Name", style="white")
 
     # Sort models by name for better readability
-    sorted_models = sorted(models.items(), key=lambda x: x[1])
+    sorted_models = sorted(models.items(), key=itemgetter(1))
 
     for model_id, model_name in sorted_models:
         table.add_row(model_id, model_name)
@@ -2015,7 +2787,7 @@ def list_models(
     console.print(table)
 
     if verbose:
-        console.print("\n[dim]API endpoint: https://models.inference.ai.azure.com/models[/dim]")
+        console.print(f"\n[dim]API endpoint: {GITHUB_MODELS_CATALOG_URL}[/dim]")
         console.print(f"[dim]Auth: {'✓ Token provided' if _github_token(github_token) else '⚠ No token (may have limited access)'}[/dim]")
 
     cache_meta = _load_models_cache_metadata()
@@ -2029,6 +2801,21 @@ def list_models(
         console.print("\n[dim]Cache: none (will populate after the first successful API call).[/dim]")
 
 
+# Built once so status lines skip Rich's markup parser
+_CACHE_STATUS_TEMPLATE = "\nModels cache: {age} old (source: {source}). Use 'specify list-models --refresh' to update."
+_CACHE_STATUS_NONE = Text("\nModels cache: none (will populate after the first successful API call).", style="dim")
+# Fixed status lines, markup-parsed and highlighted once instead of on every run
+_STATUS_HEADING = console.render_str("[bold]Project Status[/bold]\n")
+_STATUS_NOT_PROJECT = console.render_str("[red]⚠ Not a Specify project[/red] (no .specify directory found)")
+_STATUS_INIT_HINT = console.render_str("[dim]Run 'specify init .' to initialize this directory as a Specify project[/dim]")
+_STATUS_PROJECT_FOUND = console.render_str("[green]✓ Specify project detected[/green]")
+_STATUS_NO_PROMPTS = console.render_str("[yellow]⚠ No GitHub Models prompts found[/yellow]")
+_STATUS_CONFIG_UNREADABLE = console.render_str("[yellow]⚠ Model configuration file exists but could not be read[/yellow]")
+_STATUS_NO_MODEL = console.render_str("[dim]No specific model configured (will use default)[/dim]")
+_STATUS_GIT_OK = console.render_str("[green]✓ Git repository initialized[/green]")
+_STATUS_GIT_NONE = console.render_str("[dim]No git repository (use 'git init' to initialize)[/dim]")
+
+
 @app.command()
 def status(
     output_json: bool = typer.Option(
@@ -2070,19 +2857,31 @@ def status(
     config_dir = specify_dir / "config"
     models_config = config_dir / "models.json"
 
-    is_specify_project = specify_dir.exists()
+    # One listing of the working directory answers the .specify, .github and .git probes
+    try:
+        with os.scandir(current_dir) as it:
+            top_entries = {entry.name: entry for entry in it}
+    except OSError:
+        top_entries = {}
+    is_specify_project = ".specify" in top_entries
 
     prompt_files: list[Path] = []
-    if prompts_dir.exists():
-        prompt_files = sorted(prompts_dir.glob("*.md"))
+    if ".github" in top_entries:
+        try:
+            with os.scandir(prompts_dir) as it:
+                prompt_files = sorted(Path(entry.path) for entry in it if entry.name.endswith(".md"))
+        except OSError:
+            pass
 
     config_data: dict | None = None
     config_error: str | None = None
-    if models_config.exists():
-        try:
-            config_data = json.loads(models_config.read_text())
-        except Exception as exc:
-            config_error = str(exc)
+    try:
+        # Read as bytes straight into the parser; a missing file is the only existence check
+        config_data = _read_json(models_config)
+    except FileNotFoundError:
+        pass
+    except (ValueError, OSError) as exc:  # JSONDecodeError / UnicodeDecodeError are ValueErrors
+        config_error = str(exc)
 
     model_info = None
     scripts_info = None
@@ -2117,7 +2916,7 @@ def status(
         }
 
     commands = [path.stem for path in prompt_files]
-    git_repo = is_git_repo(current_dir)
+    git_repo = ".git" in top_entries or is_git_repo(current_dir)
     cache_meta = _load_models_cache_metadata()
     followups = _derive_followups(artifact_summary)
     primary_suggestion = _pick_primary_suggestion(artifact_summary)
@@ -2142,180 +2941,202 @@ def status(
     }
 
     if output_json:
-        print(json.dumps(status_payload, indent=2))
+        # Encode straight to bytes (orjson when installed) and skip print's str round trip
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_json_bytes(status_payload, indent=True) + b"\n")
+        sys.stdout.buffer.flush()
         return
 
-    if agent_mode:
-        # Agent mode: minimal, structured, easy-to-parse output
-        if not is_specify_project:
-            console.print("ERROR: Not a Specify project (missing .specify directory). Run 'specify init .' first.")
-            raise typer.Exit(1)
+    # Rich buffers everything printed inside the console context and writes it
+    # out in one go on exit, instead of issuing a write per line
+    with console:
+        if agent_mode:
+            # Agent mode: minimal, structured, easy-to-parse output
+            if not is_specify_project:
+                console.print("ERROR: Not a Specify project (missing .specify directory). Run 'specify init .' first.")
+                raise typer.Exit(1)
 
-        # Primary next step (always present)
-        next_step_text = primary_suggestion or "All core artifacts ready."
-        console.print(f"NEXT_STEP: {next_step_text}")
+            # Primary next step (always present)
+            next_step_text = primary_suggestion or "All core artifacts ready."
+            console.print(f"NEXT_STEP: {next_step_text}")
 
-        # Constitution status
-        console.print(
-            f"CONSTITUTION: {'ready' if artifact_summary.get('constitution') else 'missing'}"
-        )
+            # Constitution status
+            console.print(
+                f"CONSTITUTION: {'ready' if artifact_summary.get('constitution') else 'missing'}"
+            )
 
-        # Feature breakdown
-        if artifact_summary["features"]:
-            console.print("FEATURES:")
-            for feature in artifact_summary["features"]:
-                console.print(
-                    "- {slug}: spec={spec} plan={plan} tasks={tasks} next={next_cmd}".format(
-                        slug=feature.get("slug", "unknown"),
-                        spec="done" if feature.get("spec") else "todo",
-                        plan="done" if feature.get("plan") else "todo",
-                        tasks="done" if feature.get("tasks") else "todo",
-                        next_cmd=feature.get("next_command", "unknown"),
+            # Feature breakdown
+            if artifact_summary["features"]:
+                console.print("FEATURES:")
+                for feature in artifact_summary["features"]:
+                    console.print(
+                        "- {slug}: spec={spec} plan={plan} tasks={tasks} next={next_cmd}".format(
+                            slug=feature.get("slug", "unknown"),
+                            spec="done" if feature.get("spec") else "todo",
+                            plan="done" if feature.get("plan") else "todo",
+                            tasks="done" if feature.get("tasks") else "todo",
+                            next_cmd=feature.get("next_command", "unknown"),
+                        )
                     )
-                )
-        else:
-            console.print("FEATURES: none (run /specify to create one)")
+            else:
+                console.print("FEATURES: none (run /specify to create one)")
 
-        # Available commands
-        if commands:
-            console.print(
-                "COMMANDS: " + ", ".join(f"/{name}" for name in commands[:10]) + (
-                    " …" if len(commands) > 10 else ""
+            # Available commands
+            if commands:
+                console.print(
+                    "COMMANDS: " + ", ".join(f"/{name}" for name in commands[:10]) + (
+                        " …" if len(commands) > 10 else ""
+                    )
                 )
-            )
 
-        # Additional followup suggestions
-        if followups:
-            console.print("FOLLOWUPS:")
-            for item in followups[:5]:
-                console.print(f"- {item}")
+            # Additional followup suggestions
+            if followups:
+                console.print("FOLLOWUPS:")
+                for item in followups[:5]:
+                    console.print(f"- {item}")
 
-        return
+            return
 
-    show_banner()
+        show_banner()
 
-    console.print("[bold]Project Status[/bold]\n")
-    console.print(f"[cyan]Current Directory:[/cyan] {current_dir}")
+        # Sections are collected and printed as one Group: a single render pass for the report
+        parts: list[RenderableType] = [_STATUS_HEADING, f"[cyan]Current Directory:[/cyan] {current_dir}"]
 
-    if not is_specify_project:
-        console.print("[red]⚠ Not a Specify project[/red] (no .specify directory found)")
-        console.print("[dim]Run 'specify init .' to initialize this directory as a Specify project[/dim]")
-        return
+        if not is_specify_project:
+            parts += (_STATUS_NOT_PROJECT, _STATUS_INIT_HINT)
+            console.print(Group(*parts))
+            return
 
-    console.print("[green]✓ Specify project detected[/green]")
+        parts.append(_STATUS_PROJECT_FOUND)
 
-    if primary_suggestion:
-        console.print(f"[bold magenta]Next step:[/bold magenta] {primary_suggestion}")
+        if primary_suggestion:
+            parts.append(f"[bold magenta]Next step:[/bold magenta] {primary_suggestion}")
 
-    if prompt_files:
-        console.print(f"[cyan]AI Assistant:[/cyan] GitHub Models ({len(prompt_files)} prompts configured)")
-    else:
-        console.print("[yellow]⚠ No GitHub Models prompts found[/yellow]")
-
-    github_meta = model_info or {}
-    selected_model = github_meta.get("selected_model") if github_meta else None
-    last_updated_raw = github_meta.get("last_updated") if github_meta else None
-    catalog_source = github_meta.get("catalog_source") if github_meta else None
-    catalog_cached_at = github_meta.get("catalog_cached_at") if github_meta else None
-
-    if config_error and models_config.exists():
-        console.print("[yellow]⚠ Model configuration file exists but could not be read[/yellow]")
-    elif selected_model:
-        last_updated_dt = _parse_iso8601(last_updated_raw)
-        if last_updated_dt:
-            age = _format_age((datetime.now(timezone.utc) - last_updated_dt).total_seconds())
-            iso_stamp = last_updated_dt.isoformat().replace("+00:00", "Z")
-            console.print(
-                f"[cyan]Selected Model:[/cyan] {selected_model} [dim](set {age} ago · {iso_stamp})[/dim]"
-            )
+        if prompt_files:
+            parts.append(f"[cyan]AI Assistant:[/cyan] GitHub Models ({len(prompt_files)} prompts configured)")
         else:
-            console.print(
-                f"[cyan]Selected Model:[/cyan] {selected_model} [dim](configured {last_updated_raw or 'unknown'})[/dim]"
-            )
-    else:
-        console.print("[dim]No specific model configured (will use default)[/dim]")
-
-    if catalog_source:
-        console.print(f"[dim]Catalog source: {catalog_source}[/dim]")
+            parts.append(_STATUS_NO_PROMPTS)
+
+        github_meta = model_info or {}
+        selected_model = github_meta.get("selected_model") if github_meta else None
+        last_updated_raw = github_meta.get("last_updated") if github_meta else None
+        catalog_source = github_meta.get("catalog_source") if github_meta else None
+        catalog_cached_at = github_meta.get("catalog_cached_at") if github_meta else None
+        now_utc = datetime.now(timezone.utc)  # One clock reading keeps the ages below consistent
+
+        if config_error:
+            parts.append(_STATUS_CONFIG_UNREADABLE)
+        elif selected_model:
+            last_updated_dt = _parse_iso8601(last_updated_raw)
+            if last_updated_dt:
+                age = _format_age((now_utc - last_updated_dt).total_seconds())
+                iso_stamp = _iso_z(last_updated_dt)
+                parts.append(
+                    f"[cyan]Selected Model:[/cyan] {selected_model} [dim](set {age} ago · {iso_stamp})[/dim]"
+                )
+            else:
+                parts.append(
+                    f"[cyan]Selected Model:[/cyan] {selected_model} [dim](configured {last_updated_raw or 'unknown'})[/dim]"
+                )
+        else:
+            parts.append(_STATUS_NO_MODEL)
 
-    if catalog_cached_at:
-        cached_dt = _parse_iso8601(catalog_cached_at)
-        if cached_dt:
-            cache_age = _format_age((datetime.now(timezone.utc) - cached_dt).total_seconds())
-            console.print(
-                f"[dim]Catalog cached: {cache_age} ago ({cached_dt.isoformat().replace('+00:00', 'Z')})[/dim]"
-            )
+        if catalog_source:
+            parts.append(f"[dim]Catalog source: {catalog_source}[/dim]")
 
-    scripts_meta = scripts_info or {}
-    if scripts_meta:
-        script_flavor = scripts_meta.get("preferred", "unknown")
-        descriptor = "/".join(filter(None, [scripts_meta.get("folder"), scripts_meta.get("extension")]))
-        last_script_dt = _parse_iso8601(scripts_meta.get("last_updated"))
-        if last_script_dt:
-            script_age = _format_age((datetime.now(timezone.utc) - last_script_dt).total_seconds())
-            console.print(
-                f"[cyan]Script Flavor:[/cyan] {script_flavor} [dim]({descriptor or 'n/a'}, updated {script_age} ago)[/dim]"
-            )
-        else:
-            console.print(f"[cyan]Script Flavor:[/cyan] {script_flavor} [dim]({descriptor or 'n/a'})[/dim]")
+        if catalog_cached_at:
+            cached_dt = _parse_iso8601(catalog_cached_at)
+            if cached_dt:
+                cache_age = _format_age((now_utc - cached_dt).total_seconds())
+                parts.append(
+                    f"[dim]Catalog cached: {cache_age} ago ({_iso_z(cached_dt)})[/dim]"
+                )
 
-    _render_workflow_summary(artifact_summary)
-    _render_feature_details(artifact_summary)
+        scripts_meta = scripts_info or {}
+        if scripts_meta:
+            script_flavor = scripts_meta.get("preferred", "unknown")
+            descriptor = "/".join(filter(None, [scripts_meta.get("folder"), scripts_meta.get("extension")]))
+            last_script_dt = _parse_iso8601(scripts_meta.get("last_updated"))
+            if last_script_dt:
+                script_age = _format_age((now_utc - last_script_dt).total_seconds())
+                parts.append(
+                    f"[cyan]Script Flavor:[/cyan] {script_flavor} [dim]({descriptor or 'n/a'}, updated {script_age} ago)[/dim]"
+                )
+            else:
+                parts.append(f"[cyan]Script Flavor:[/cyan] {script_flavor} [dim]({descriptor or 'n/a'})[/dim]")
 
-    if git_repo:
-        console.print("[green]✓ Git repository initialized[/green]")
-    else:
-        console.print("[dim]No git repository (use 'git init' to initialize)[/dim]")
+        parts.append(_render_workflow_summary(artifact_summary))
+        parts.append(_render_feature_details(artifact_summary))
 
-    if prompt_files:
-        console.print(f"\n[bold]Available Commands ({len(prompt_files)}):[/bold]")
-        for name in commands:
-            console.print(f"  [cyan]/{name}[/cyan]")
+        if git_repo:
+            parts.append(_STATUS_GIT_OK)
+        else:
+            parts.append(_STATUS_GIT_NONE)
+
+        if prompt_files:
+            # Styled spans instead of markup: nothing to parse, and command names are taken literally
+            listing = Text.assemble(
+                "\n",
+                ("Available Commands (", "bold"),
+                (str(len(prompt_files)), "bold cyan"),  # As Console's number highlighter styled it
+                ("):", "bold"),
+            )
+            for name in commands:
+                listing.append("\n  ")
+                listing.append(f"/{name}", style="cyan")
+            parts.append(listing)
+
+        if cache_meta:
+            age_human = _format_age(cache_meta.get("age_seconds"))
+            source = cache_meta.get("source", "unknown")
+            parts.append(Text(_CACHE_STATUS_TEMPLATE.format(age=age_human, source=source), style="dim"))
+        else:
+            parts.append(_CACHE_STATUS_NONE)
 
-    if cache_meta:
-        age_human = _format_age(cache_meta.get("age_seconds"))
-        source = cache_meta.get("source", "unknown")
-        console.print(
-            f"\n[dim]Models cache: {age_human} old (source: {source}). Use 'specify list-models --refresh' to update.[/dim]"
-        )
-    else:
-        console.print(
-            "\n[dim]Models cache: none (will populate after the first successful API call).[/dim]"
-        )
+        console.print(Group(*parts))
 
 
 @app.command()
-def version():
+def version(
+    plain: bool = typer.Option(False, "--plain", help="Print only the version string"),
+):
     """Show version information."""
+    # Scripts and pipes only need the version; skip the banner and Rich rendering
+    if plain or not sys.stdout.isatty():
+        print(f"specify-cli {__version__}")
+        return
+
     show_banner()
 
-    # Try to get version from package metadata
+    # Show cache info if available (a single stat serves as the existence check)
     try:
-        import importlib.metadata
-        pkg_version = importlib.metadata.version("specify-cli")
-    except (importlib.metadata.PackageNotFoundError, ImportError):
-        # Fallback version if package not installed or importlib unavailable
-        pkg_version = "development"
-
-    console.print(f"[bold]Specify CLI Version:[/bold] {pkg_version}")
-    console.print(f"[cyan]Python:[/cyan] {sys.version.split()[0]}")
-    console.print(f"[cyan]Platform:[/cyan] {sys.platform}")
-
-    # Show cache info if available
-    cache_file = Path.home() / ".specify" / "models_cache.json"
-    if cache_file.exists():
-        import time
-        cache_stat = cache_file.stat()
-        cache_age = time.time() - cache_stat.st_mtime
-        if cache_age < CACHE_TTL_SECONDS:
-            console.print(f"[dim]Models cache: ✓ (fresh, {int(cache_age/60)} minutes old)[/dim]")
-        else:
-            console.print(f"[dim]Models cache: ⚠ (stale, {int(cache_age/3600)} hours old)[/dim]")
+        cache_mtime_ns = os.stat(_MODELS_CACHE_FILE).st_mtime_ns
+    except OSError:
+        # Missing, unreadable, or ~/.specify is not a directory: report it like no cache
+        cache_status = "none"
     else:
-        console.print("[dim]Models cache: none[/dim]")
+        cache_age = (time.time_ns() - cache_mtime_ns) // 1_000_000_000
+        residency = _page_cache_residency(_MODELS_CACHE_FILE)
+        resident = "" if residency is None else f", {residency}% resident"
+        freshness = "✓ (fresh" if cache_age < CACHE_TTL_SECONDS else "⚠ (stale"
+        cache_status = f"{freshness}, {_format_cache_age(cache_age)} old{resident})"
+
+    # Static labels only need fixed escape codes, not Rich's markup parser
+    bold, cyan, dim, reset = _ANSI_STYLES
+    sys.stdout.write(
+        f"{bold}Specify CLI Version:{reset} {__version__}\n"
+        f"{cyan}Python:{reset} {_PY_VERSION}\n"
+        f"{cyan}Platform:{reset} {sys.platform}\n"
+        f"{dim}Models cache: {cache_status}{reset}\n"
+    )
 
 
 def main():
+    # Plain `specify version` output needs no Typer/Click command parsing
+    args = sys.argv[1:]
+    if args[:1] == ["version"] and (args[1:] == ["--plain"] or (not args[1:] and not sys.stdout.isatty())):
+        print(f"specify-cli {__version__}")
+        return
     app()
 
 
@@ -0,0 +1,3 @@
+"""Version of the specify-cli package (updated by the release workflow)."""
+
+__version__ = "1.0.3"
@@ -2,18 +2,19 @@
 Pytest configuration and fixtures for Specify CLI tests.
 """
 
+from types import MappingProxyType
+
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 
 
 @pytest.fixture
-def temp_workspace():
-    """Create a temporary workspace directory for testing."""
-    temp_dir = tempfile.mkdtemp(prefix="specify-test-")
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_workspace(tmp_path):
+    """Create a temporary workspace directory for testing.
+
+    Backed by pytest's tmp_path, which lives under a per-session root that
+    pytest prunes itself, so no per-test cleanup is needed.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -22,14 +23,18 @@ def mock_github_token():
     return "ghp_mock_token_for_testing_only"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_models():
-    """Provide sample model data for testing."""
-    return {
+    """Provide sample model data for testing.
+
+    Built once per session and read-only, so a test that mutates it fails
+    instead of leaking changes into later tests.
+    """
+    return MappingProxyType({
         "gpt-4o": "GPT-4o",
         "gpt-4o-mini": "GPT-4o mini",
         "claude-sonnet-4.5": "Claude Sonnet 4.5",
         "claude-sonnet-4": "Claude Sonnet 4",
         "llama-3.3-70b-instruct": "Llama 3.3 70B Instruct",
         "phi-4": "Phi-4",
-    }
+    })
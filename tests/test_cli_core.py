@@ -1,10 +1,30 @@
 """
 Core CLI functionality tests - focused on actual CLI behavior.
+
+Commands run in-process through Typer's CliRunner; test_version_command keeps
+one end-to-end run of the installed ``specify`` entry point.
 """
 
 import subprocess
-import json
-from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import specify_cli
+from specify_cli import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def offline_models(monkeypatch, sample_models):
+    """Serve list-models from sample data instead of the GitHub Models API."""
+    monkeypatch.setattr(
+        specify_cli,
+        "fetch_github_models",
+        lambda github_token=None, use_cache=True: sample_models,
+    )
+    return sample_models
 
 
 def test_version_command():
@@ -19,66 +39,61 @@ def test_version_command():
 
 def test_help_command():
     """Test specify --help command."""
-    result = subprocess.run(
-        ["specify", "--help"],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["--help"])
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     assert "init" in result.stdout
     assert "status" in result.stdout
     assert "list-models" in result.stdout
 
 
-def test_list_models_command():
+def test_list_models_command(offline_models):
     """Test specify list-models command."""
-    result = subprocess.run(
-        ["specify", "list-models"],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["list-models"])
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
 
     # Should list major models
     assert "gpt-4o" in result.stdout
     assert "claude" in result.stdout.lower()
 
 
-def test_list_models_includes_claude():
+def test_list_models_includes_claude(offline_models):
     """Test that list-models includes Claude models."""
-    result = subprocess.run(
-        ["specify", "list-models"],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["list-models"])
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     # Check for any Claude mention
     assert "claude-sonnet" in result.stdout.lower() or "claude sonnet" in result.stdout.lower()
 
 
+def test_init_suggests_models_for_unknown_model(offline_models, monkeypatch, tmp_path):
+    """An unknown --model lists close catalog matches and exits."""
+    monkeypatch.setattr(specify_cli, "prefetch_latest_release_metadata", lambda *a, **k: None)
+    monkeypatch.chdir(tmp_path)
+
+    substring = runner.invoke(app, ["init", "--here", "--no-git", "--model", "CLAUDE"])
+    assert substring.exit_code == 1
+    assert "claude-sonnet-4" in substring.stdout
+    assert "gpt-4o" not in substring.stdout
+
+    typo = runner.invoke(app, ["init", "--here", "--no-git", "--model", "gtp-4o"])
+    assert typo.exit_code == 1
+    assert "gpt-4o" in typo.stdout
+
+
 def test_check_command():
     """Test specify check command."""
-    result = subprocess.run(
-        ["specify", "check"],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["check"])
 
     # Should succeed
-    assert result.returncode == 0
+    assert result.exit_code == 0
     assert "git" in result.stdout.lower() or "visual studio code" in result.stdout.lower()
 
 
 def test_invalid_command():
     """Test invalid command shows help."""
-    result = subprocess.run(
-        ["specify", "invalid-command"],
-        capture_output=True,
-        text=True,
-    )
+    result = runner.invoke(app, ["invalid-command"])
 
     # Should fail
-    assert result.returncode != 0
+    assert result.exit_code != 0
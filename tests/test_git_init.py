@@ -0,0 +1,52 @@
+"""
+Tests for the repository created by ``specify init``.
+"""
+
+import shutil
+import stat
+
+import pytest
+
+import specify_cli
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture
+def git_env(monkeypatch, tmp_path):
+    """Give git an identity and a global hooks directory via the environment."""
+    hooks = tmp_path / "hooks"
+    hooks.mkdir()
+    for role in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{role}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "core.hooksPath")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", str(hooks))
+    return hooks
+
+
+def _install_hook(hooks, body):
+    hook = hooks / "pre-commit"
+    hook.write_text(f"#!/bin/sh\n{body}\n")
+    hook.chmod(hook.stat().st_mode | stat.S_IXUSR)
+
+
+def test_init_git_repo_commits_project(git_env, tmp_path):
+    """The initial commit is created and the path is then seen as a worktree."""
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "README.md").write_text("hello")
+
+    assert specify_cli.init_git_repo(project, quiet=True) is True
+    assert specify_cli.is_git_repo(project)
+
+
+def test_init_git_repo_runs_user_hooks(git_env, tmp_path):
+    """A rejecting pre-commit hook (e.g. a secret scanner) is honoured, not bypassed."""
+    _install_hook(git_env, "exit 1")
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "secrets.env").write_text("TOKEN=abc")
+
+    assert specify_cli.init_git_repo(project, quiet=True) is False
@@ -0,0 +1,67 @@
+"""
+Tests for decoding arrow-key input in the selection prompt.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+import specify_cli
+
+
+def test_decode_coalesced_burst():
+    """Several keys delivered in one read decode to one name each."""
+    data = b"\x1b[A\x1b[A\x1bOB\x1b[B\rq"
+    assert specify_cli._decode_key_burst(data) == ["up", "up", "down", "down", "enter", "q"]
+
+
+def test_decode_lone_escape():
+    """A bare ESC byte is the Esc key."""
+    assert specify_cli._decode_key_burst(b"\x1b") == ["escape"]
+
+
+@pytest.mark.parametrize("head", [b"\x1b", b"\x1b[", b"\x1bO", b"\x1b[1;", b"\x1b[A\x1b"])
+def test_partial_escape_detected(head):
+    """A read that stops inside an escape sequence is recognised as incomplete."""
+    assert specify_cli._PARTIAL_ESCAPE_RE.search(head)
+
+
+@pytest.mark.parametrize("data", [b"\x1b[A", b"\x1bOB", b"\r", b"k", b"\x1b[A\x1b[B"])
+def test_complete_input_not_partial(data):
+    """Complete keys never trigger the wait for more bytes."""
+    assert not specify_cli._PARTIAL_ESCAPE_RE.search(data)
+
+
+def test_split_sequences_join_to_keys():
+    """The halves of a split sequence decode as the original key once joined."""
+    for split in (1, 2):
+        seq = b"\x1b[A"
+        head, tail = seq[:split], seq[split:]
+        assert specify_cli._PARTIAL_ESCAPE_RE.search(head)
+        assert specify_cli._decode_key_burst(head + tail) == ["up"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminal input only")
+def test_read_key_burst_waits_for_split_arrow(monkeypatch):
+    """An arrow whose bytes arrive in two writes is read as one key, not Esc."""
+    master, slave = os.openpty()
+    with os.fdopen(slave, "r") as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        os.write(master, b"\x1b")
+
+        def finish():
+            time.sleep(0.02)
+            os.write(master, b"[A")
+
+        writer = threading.Thread(target=finish)
+        writer.start()
+        try:
+            keys = specify_cli._read_key_burst()
+        finally:
+            writer.join()
+            os.close(master)
+
+    assert keys == ["up"]
@@ -0,0 +1,99 @@
+"""
+Tests for the local models cache helpers behind ``specify version``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import specify_cli
+
+
+@pytest.mark.parametrize("machine", ["mips", "mips64", "alpha", "sparc64"])
+def test_cachestat_skipped_on_other_syscall_tables(monkeypatch, machine):
+    """Architectures that do not number cachestat 451 never issue the syscall."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(os, "uname", lambda: SimpleNamespace(machine=machine, release="6.8.0"))
+
+    assert specify_cli._kernel_has_cachestat() is False
+    assert specify_cli._page_cache_residency(__file__) is None
+
+
+@pytest.mark.parametrize(("machine", "release", "expected"), [
+    ("x86_64", "6.5.0", True),
+    ("aarch64", "6.12.1-arch1", True),
+    ("x86_64", "6.4.16", False),
+])
+def test_cachestat_kernel_gate(monkeypatch, machine, release, expected):
+    """cachestat is used on 451 architectures from kernel 6.5 on."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(os, "uname", lambda: SimpleNamespace(machine=machine, release=release))
+
+    assert specify_cli._kernel_has_cachestat() is expected
+
+
+@pytest.mark.skipif(not specify_cli._kernel_has_cachestat(), reason="cachestat(2) unavailable")
+def test_page_cache_residency_reads_percentage(tmp_path):
+    """A file just written is reported as a percentage of its pages."""
+    path = tmp_path / "cache.json"
+    path.write_bytes(b"x" * 10000)
+
+    residency = specify_cli._page_cache_residency(str(path))
+    assert residency is not None and 0 <= residency <= 100
+
+
+def test_import_does_not_load_ctypes():
+    """Only the cachestat path needs ctypes; plain imports and other commands skip it."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, specify_cli; print('ctypes' in sys.modules)"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.fixture
+def tty_version(monkeypatch, capsys, tmp_path):
+    """Run the rich `version` output against a models cache path under tmp_path."""
+    cache_file = tmp_path / "models_cache.json"
+    monkeypatch.setattr(specify_cli, "_MODELS_CACHE_FILE", str(cache_file))
+
+    def run():
+        # Patched per call: pytest swaps sys.stdout between the setup and call phases
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        specify_cli.version(plain=False)
+        return capsys.readouterr().out
+
+    run.cache_file = cache_file
+    return run
+
+
+def test_version_reports_missing_cache(tty_version):
+    """Without a cache file, version reports none."""
+    assert "Models cache: none" in tty_version()
+
+
+def test_version_sees_cache_written_in_same_process(tty_version):
+    """The cache is stat'ed on each call, so a fresh write shows up straight away."""
+    assert "Models cache: none" in tty_version()
+    specify_cli._save_models_cache(tty_version.cache_file, {"gpt-4o": "GPT-4o"}, "api")
+
+    assert "Models cache: ✓ (fresh" in tty_version()
+
+
+def test_cache_directory_matches_path_home():
+    """The caches live under the same home directory Path.home() reports on every platform."""
+    assert specify_cli._SPECIFY_HOME == os.path.join(str(Path.home()), ".specify")
+
+
+def test_version_reports_none_when_cache_dir_is_a_file(tty_version, monkeypatch, tmp_path):
+    """A ~/.specify that is a file (NotADirectoryError) is reported, not a traceback."""
+    blocker = tmp_path / "specify-file"
+    blocker.write_text("not a directory")
+    monkeypatch.setattr(specify_cli, "_MODELS_CACHE_FILE", str(blocker / "models_cache.json"))
+
+    assert "Models cache: none" in tty_version()
@@ -0,0 +1,186 @@
+"""
+Tests for the GitHub API paths: release prefetch and cache revalidation.
+
+No test here touches the network; requests go to httpx.MockTransport or to
+monkeypatched fetch functions.
+"""
+
+import json
+import os
+import threading
+import time
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+import specify_cli
+from specify_cli import app
+
+runner = CliRunner()
+
+
+def test_prefetch_runs_on_daemon_thread(monkeypatch):
+    """The prefetch resolves to the fetch result without blocking interpreter exit."""
+    seen = {}
+
+    def fake_fetch(client, github_token=None, debug=False):
+        seen["daemon"] = threading.current_thread().daemon
+        return {"tag_name": "v1"}
+
+    monkeypatch.setattr(specify_cli, "fetch_latest_release_metadata", fake_fetch)
+    future = specify_cli.prefetch_latest_release_metadata(client=None)
+
+    assert future.result(timeout=5) == {"tag_name": "v1"}
+    assert seen["daemon"] is True
+
+
+def test_prefetch_reraises_fetch_errors(monkeypatch):
+    """Errors from the background lookup surface from result()."""
+
+    def failing_fetch(client, github_token=None, debug=False):
+        raise RuntimeError("GitHub API returned 500")
+
+    monkeypatch.setattr(specify_cli, "fetch_latest_release_metadata", failing_fetch)
+    future = specify_cli.prefetch_latest_release_metadata(client=None)
+
+    assert isinstance(future.exception(timeout=5), RuntimeError)
+
+
+def test_init_rejects_bad_flags_before_prefetch(monkeypatch, tmp_path):
+    """Invalid --ai/--script values exit before any release lookup starts."""
+    calls = []
+    monkeypatch.setattr(specify_cli, "prefetch_latest_release_metadata", lambda *a, **k: calls.append(a))
+    monkeypatch.chdir(tmp_path)
+
+    for flag in (["--ai", "bogus"], ["--script", "bogus"]):
+        result = runner.invoke(app, ["init", "--here", "--no-git", *flag])
+        assert result.exit_code == 1
+        assert "Invalid" in result.stdout
+
+    assert calls == []
+
+
+@pytest.fixture
+def mock_api(monkeypatch, tmp_path):
+    """Route specify's HTTP client to a MockTransport and its caches to tmp_path.
+
+    Yields ``(requests, dispatch)``: the requests seen so far, and the transport
+    callable whose ``handler`` attribute each test sets to answer them.
+    """
+    requests = []
+
+    def dispatch(request):
+        requests.append(request)
+        return dispatch.handler(request)
+
+    client = httpx.Client(transport=httpx.MockTransport(dispatch))
+    cache_file = tmp_path / "models_cache.json"
+    monkeypatch.setattr(specify_cli, "_get_client", lambda: client)
+    monkeypatch.setattr(specify_cli, "_MODELS_CACHE_FILE", str(cache_file))
+    monkeypatch.setattr(specify_cli, "_MODELS_CACHE_PATH", cache_file)
+    monkeypatch.setattr(specify_cli, "_RELEASE_CACHE_PATH", tmp_path / "release_cache.json")
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    specify_cli._github_auth_headers.cache_clear()
+    specify_cli._fetch_github_models.cache_clear()
+    yield requests, dispatch
+    specify_cli._fetch_github_models.cache_clear()
+    client.close()
+
+
+def _write_stale_models_cache(path, source="api"):
+    path.write_text(json.dumps({
+        "models": {"cached-model": "Cached Model"},
+        "timestamp": 0,
+        "source": source,
+        "etag": '"v1"',
+        "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }))
+    stale = time.time() - specify_cli.CACHE_TTL_SECONDS - 60
+    os.utime(path, (stale, stale))
+
+
+def test_stale_models_cache_revalidates_on_304(mock_api):
+    """A stale API catalog is revalidated, and a 304 serves it and restarts the TTL."""
+    requests, dispatch = mock_api
+    dispatch.handler = lambda request: httpx.Response(304)
+    cache_file = specify_cli._MODELS_CACHE_PATH
+    _write_stale_models_cache(cache_file)
+
+    models = specify_cli.fetch_github_models()
+
+    assert dict(models) == {"cached-model": "Cached Model"}
+    assert requests[0].headers["If-None-Match"] == '"v1"'
+    assert requests[0].headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    # Re-saved: fresh mtime, validators kept for the next revalidation
+    assert time.time() - cache_file.stat().st_mtime < specify_cli.CACHE_TTL_SECONDS
+    saved = json.loads(cache_file.read_text())
+    assert saved["etag"] == '"v1"'
+    assert saved["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_models_200_stores_validators(mock_api):
+    """A full catalog response saves its ETag and Last-Modified with the models."""
+    requests, dispatch = mock_api
+    dispatch.handler = lambda request: httpx.Response(
+        200,
+        json=[{"id": "openai/new-model", "name": "New Model"}],
+        headers={"ETag": '"v2"', "Last-Modified": "Thu, 02 Jan 2025 00:00:00 GMT"},
+    )
+
+    models = specify_cli.fetch_github_models()
+
+    assert models["new-model"] == "New Model"
+    assert "If-None-Match" not in requests[0].headers
+    saved = json.loads(specify_cli._MODELS_CACHE_PATH.read_text())
+    assert saved["source"] == "api"
+    assert saved["etag"] == '"v2"'
+
+
+def test_fallback_models_cache_never_revalidates(mock_api):
+    """A cache holding the fallback list is refetched in full, without validators."""
+    requests, dispatch = mock_api
+    dispatch.handler = lambda request: httpx.Response(
+        200, json=[{"id": "openai/new-model", "name": "New Model"}]
+    )
+    _write_stale_models_cache(specify_cli._MODELS_CACHE_PATH, source="fallback")
+
+    models = specify_cli.fetch_github_models()
+
+    assert "new-model" in models
+    assert "If-None-Match" not in requests[0].headers
+    assert "If-Modified-Since" not in requests[0].headers
+
+
+def test_release_metadata_revalidates_on_304(mock_api):
+    """The cached release is sent with its validators and returned on a 304."""
+    requests, dispatch = mock_api
+    release = {"tag_name": "v1.0.0", "assets": []}
+    dispatch.handler = lambda request: httpx.Response(
+        200, json=release, headers={"ETag": '"r1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    )
+    client = specify_cli._get_client()
+
+    assert specify_cli.fetch_latest_release_metadata(client) == release
+    assert "If-None-Match" not in requests[0].headers
+
+    dispatch.handler = lambda request: httpx.Response(304)
+    assert specify_cli.fetch_latest_release_metadata(client) == release
+    assert requests[1].headers["If-None-Match"] == '"r1"'
+    assert requests[1].headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def test_uncached_fetch_keeps_memo(mock_api):
+    """use_cache=False bypasses the per-process memo without clearing it."""
+    requests, dispatch = mock_api
+    dispatch.handler = lambda request: httpx.Response(
+        200, json=[{"id": "openai/new-model", "name": "New Model"}]
+    )
+
+    specify_cli.fetch_github_models()
+    specify_cli.fetch_github_models(use_cache=False)
+    specify_cli.fetch_github_models()
+
+    assert len(requests) == 2
+    assert specify_cli._fetch_github_models.cache_info().currsize == 1
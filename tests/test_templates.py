@@ -0,0 +1,205 @@
+"""
+Tests for unpacking template archives into a project.
+
+Archives are built in memory with zipfile; nothing is downloaded.
+"""
+
+import io
+import sys
+import zipfile
+
+import pytest
+import typer
+
+import specify_cli
+
+
+def make_zip(entries):
+    """Build an in-memory zip; names ending in "/" become directory entries."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name in entries:
+            zf.writestr(name, "" if name.endswith("/") else f"content of {name}")
+    return buf.getvalue()
+
+
+def extract(data, dest, strip_prefix=""):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        infos = zf.infolist()
+    specify_cli._extract_zip(data, dest, infos, strip_prefix=strip_prefix)
+
+
+def test_extract_zip_writes_nested_files(tmp_path):
+    """Files land at their archive paths, including across the thread pool."""
+    names = [f"docs/d{i % 3}/f{i}.md" for i in range(12)] + ["README.md"]
+    extract(make_zip(names), tmp_path)
+
+    for name in names:
+        assert (tmp_path / name).read_text() == f"content of {name}"
+
+
+def test_extract_zip_strips_root_prefix(tmp_path):
+    """strip_prefix removes the archive's root folder and skips entries outside it."""
+    data = make_zip(["root/", "root/.specify/a.sh", "root/README.md", "other.txt"])
+    extract(data, tmp_path, strip_prefix="root/")
+
+    assert (tmp_path / ".specify" / "a.sh").read_text() == "content of root/.specify/a.sh"
+    assert (tmp_path / "README.md").exists()
+    assert not (tmp_path / "root").exists()
+    assert not (tmp_path / "other.txt").exists()
+
+
+def test_extract_zip_creates_directory_only_members(tmp_path):
+    """Directory entries with no files under them still become directories."""
+    extract(make_zip(["empty/", "deep/nested/dir/", "file.txt"]), tmp_path)
+
+    assert (tmp_path / "empty").is_dir()
+    assert (tmp_path / "deep" / "nested" / "dir").is_dir()
+    assert (tmp_path / "file.txt").is_file()
+
+
+@pytest.mark.parametrize("name", [
+    "../escape.txt",
+    "safe/../../escape.txt",
+    "safe\\..\\..\\escape.txt",
+    "/etc/absolute.txt",
+    "\\absolute.txt",
+])
+def test_extract_zip_rejects_unsafe_paths(tmp_path, name):
+    """Traversal and absolute names abort extraction before anything is written."""
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        extract(make_zip(["ok.txt", name]), dest)
+    assert not (tmp_path / "escape.txt").exists()
+    assert list(dest.iterdir()) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="':' is reserved in Windows file names")
+def test_extract_zip_allows_colon_on_posix(tmp_path):
+    """A colon is an ordinary file name character outside Windows."""
+    extract(make_zip(["notes/12:30.md", "C:/odd.txt"]), tmp_path)
+
+    assert (tmp_path / "notes" / "12:30.md").is_file()
+    assert (tmp_path / "C:" / "odd.txt").is_file()
+
+
+def layout(names):
+    with zipfile.ZipFile(io.BytesIO(make_zip(names))) as zf:
+        return specify_cli._archive_layout(zf.infolist())
+
+
+def test_archive_layout_github_single_root():
+    """Every entry under one folder: that folder is the prefix and its children are the top level."""
+    names = ["spec-kit-abc/.specify/memory/c.md", "spec-kit-abc/.github/prompts/p.md", "spec-kit-abc/README.md"]
+
+    assert layout(names) == ("spec-kit-abc/", {".specify": True, ".github": True, "README.md": False})
+
+
+def test_archive_layout_explicit_root_directory_entries():
+    """Directory entries for the root and its children do not break root detection."""
+    names = ["root/", "root/.specify/", "root/.specify/a.sh", "root/empty/", "root/README.md"]
+
+    assert layout(names) == ("root/", {".specify": True, "empty": True, "README.md": False})
+
+
+def test_archive_layout_multiple_roots():
+    """Entries under several top-level folders keep their full paths."""
+    names = [".specify/a.sh", ".github/prompts/p.md", ".specify/b.sh"]
+
+    assert layout(names) == ("", {".specify": True, ".github": True})
+
+
+def test_archive_layout_root_with_top_level_file():
+    """A file beside the single folder means there is no shared root."""
+    for names in (["root/a.md", "root/b/c.md", "README.md"], ["README.md", "root/a.md"]):
+        assert layout(names) == ("", {"root": True, "README.md": False})
+
+
+def test_archive_layout_empty_archive():
+    """An empty archive has no prefix and no top-level items."""
+    assert layout([]) == ("", {})
+
+
+@pytest.fixture
+def serve_archive(monkeypatch, tmp_path):
+    """Make download_template_from_github return an in-memory archive; returns a setter."""
+    monkeypatch.chdir(tmp_path)
+    served = {}
+
+    def fake_download(ai_assistant, download_dir, **kwargs):
+        return served["data"], {"release": "v1", "size": len(served["data"]), "filename": "t.zip"}
+
+    monkeypatch.setattr(specify_cli, "download_template_from_github", fake_download)
+    return lambda names: served.update(data=make_zip(names))
+
+
+def test_download_and_extract_renames_staged_project(serve_archive, tmp_path):
+    """A new project is extracted under its staging name and renamed into place."""
+    serve_archive(["root/.specify/memory/c.md", "root/README.md"])
+    project = tmp_path / "proj"
+
+    specify_cli.download_and_extract_template(project, "copilot", "sh", verbose=False)
+
+    assert (project / ".specify" / "memory" / "c.md").is_file()
+    assert (project / "README.md").is_file()
+    assert not (tmp_path / ".proj.specify-tmp").exists()
+
+
+def test_download_and_extract_failure_leaves_nothing(serve_archive, tmp_path):
+    """A failed extraction leaves neither the project nor its staging directory."""
+    serve_archive(["root/README.md", "root/../../escape.txt"])
+    project = tmp_path / "proj"
+
+    with pytest.raises(typer.Exit):
+        specify_cli.download_and_extract_template(project, "copilot", "sh", verbose=False)
+
+    assert not project.exists()
+    assert not (tmp_path / ".proj.specify-tmp").exists()
+
+
+def test_download_and_extract_clears_stale_staging_dir(serve_archive, tmp_path):
+    """Leftovers from an interrupted earlier run do not end up in the new project."""
+    stale = tmp_path / ".proj.specify-tmp"
+    (stale / "old").mkdir(parents=True)
+    (stale / "old" / "leftover.txt").write_text("stale")
+    serve_archive(["root/README.md"])
+    project = tmp_path / "proj"
+
+    specify_cli.download_and_extract_template(project, "copilot", "sh", verbose=False)
+
+    assert sorted(p.name for p in project.iterdir()) == ["README.md"]
+    assert not stale.exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="directory symlinks need privileges on Windows")
+def test_remove_tree_refuses_symlinked_root(tmp_path):
+    """A symlinked root is refused like shutil.rmtree does, and its target is left intact."""
+    target = tmp_path / "target"
+    (target / "sub").mkdir(parents=True)
+    (target / "sub" / "keep.txt").write_text("keep")
+    link = tmp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+
+    with pytest.raises(OSError):
+        specify_cli._remove_tree(link)
+
+    assert (target / "sub" / "keep.txt").read_text() == "keep"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="directory symlinks need privileges on Windows")
+def test_download_and_extract_keeps_symlinked_staging_target(serve_archive, tmp_path):
+    """A symlinked staging directory aborts init instead of emptying whatever it points to."""
+    target = tmp_path / "elsewhere"
+    target.mkdir()
+    (target / "important.txt").write_text("keep")
+    (tmp_path / ".proj.specify-tmp").symlink_to(target, target_is_directory=True)
+    serve_archive(["root/README.md"])
+    project = tmp_path / "proj"
+
+    with pytest.raises(typer.Exit):
+        specify_cli.download_and_extract_template(project, "copilot", "sh", verbose=False)
+
+    assert (target / "important.txt").read_text() == "keep"
+    assert not project.exists()